@@ -10,7 +10,7 @@ from dataclasses import dataclass, asdict
 from ..models.runtime import OllamaRuntime, GenerationResult
 
 
-@dataclass
+@dataclass(slots=True)
 class SynthesizerQuestions:
     """Questions generated for workers."""
     questions_by_worker: Dict[str, List[str]]
@@ -38,7 +38,7 @@ class SynthesizerQuestions:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     """A synthesized candidate solution."""
     id: str
@@ -53,7 +53,7 @@ class Candidate:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateScore:
     """AI score for a candidate."""
     candidate_id: str
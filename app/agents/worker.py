@@ -3,7 +3,9 @@ AI Council - Worker Agent
 Fast agents that generate diverse candidate solutions with persona support.
 """
 
+import codecs
 import json
+import re
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 
@@ -11,7 +13,28 @@ from ..models.runtime import OllamaRuntime, GenerationResult
 from ..personas.manager import Persona
 
 
-@dataclass
+# Backslash escapes that models commonly leave in double-encoded JSON
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\", "/": "/"}
+_SIMPLE_ESCAPE_RE = re.compile(r'\\(["\\/nrt])')
+_OTHER_ESCAPE_RE = re.compile(r'\\[^"\\/nrt]')
+
+# First JSON object that mentions "axioms" in free-form model output
+_AXIOMS_RE = re.compile(r'\{[\s\S]*?"axioms"[\s\S]*?\}')
+
+
+def _unescape(text: str) -> str:
+    """
+    Undo one level of backslash escaping in model output.
+    
+    The common escapes are replaced in a single regex pass; the generic
+    unicode_escape codec is only used when other escapes (e.g. \\uXXXX) appear.
+    """
+    if _OTHER_ESCAPE_RE.search(text):
+        return codecs.decode(text, 'unicode_escape')
+    return _SIMPLE_ESCAPE_RE.sub(lambda m: _SIMPLE_ESCAPES[m.group(1)], text)
+
+
+@dataclass(slots=True)
 class WorkerDraft:
     """Structured output from a worker draft."""
     summary: str
@@ -49,7 +72,7 @@ class WorkerDraft:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerRefinement:
     """Structured output from a worker refinement."""
     answers_to_questions: Dict[str, str]
@@ -86,7 +109,7 @@ class WorkerRefinement:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerArgument:
     """Worker's argument for why their proposal is best."""
     main_argument: str
@@ -341,6 +364,17 @@ Be specific and concrete. Show real collaboration, not just agreement."""
         """Add a message to the worker's accumulated context."""
         self._context_messages.append({"role": role, "content": content})
     
+    def _record_history(self, stage: str, tokens: int, in_context: bool = True) -> None:
+        """
+        Record a completed exchange in the worker history.
+        
+        Entries are (stage, offset, tokens) tuples. The prompt and response
+        are the last two entries of _context_messages, so only their offset
+        is stored rather than another copy of the text.
+        """
+        offset = len(self._context_messages) - 2 if in_context else None
+        self._history.append((stage, offset, tokens))
+    
     def _get_context_for_call(self, include_system: bool = True) -> List[Dict[str, str]]:
         """Get the accumulated context for an API call."""
         messages = []
@@ -365,7 +399,7 @@ Be specific and concrete. Show real collaboration, not just agreement."""
             "context_used": self._cumulative_context,
             "context_limit": self._context_limit
         }
-        self._total_tokens += self._last_token_usage.get("total_tokens", 0)
+        self._total_tokens += total
     
     @property
     def system_prompt(self) -> str:
@@ -375,11 +409,20 @@ Be specific and concrete. Show real collaboration, not just agreement."""
         return "You are a helpful assistant that provides thoughtful, structured responses."
     
     @property
-    def display_id(self) -> str:
-        """Get display ID combining persona name and worker ID."""
-        if self.persona and self.persona.name:
-            return f"{self.persona.name} ({self.worker_id})"
-        return self.worker_id
+    def persona(self) -> Optional[Persona]:
+        """The worker's persona, if any."""
+        return self._persona
+    
+    @persona.setter
+    def persona(self, persona: Optional[Persona]):
+        # Payloads and log entries read these for every event, so derive them once per persona
+        self._persona = persona
+        self.persona_id: Optional[str] = persona.id if persona else None
+        self.persona_name: Optional[str] = persona.name if persona else None
+        if persona and persona.name:
+            self.display_id = f"{persona.name} ({self.worker_id})"
+        else:
+            self.display_id = self.worker_id
     
     def set_persona(self, persona: Persona):
         """Set or update the worker's persona."""
@@ -416,6 +459,7 @@ Be specific and concrete. Show real collaboration, not just agreement."""
         
         # Clear context and start fresh for this session
         self._context_messages = []
+        self._history = []
         
         # Add the draft prompt to context
         self._add_to_context("user", full_prompt)
@@ -435,12 +479,7 @@ Be specific and concrete. Show real collaboration, not just agreement."""
         
         draft = WorkerDraft.from_json(result.text)
         self.current_draft = draft
-        self._history.append({
-            "stage": "draft",
-            "input": full_prompt,
-            "output": result.text,
-            "tokens": result.tokens
-        })
+        self._record_history("draft", result.tokens)
         
         return draft
     
@@ -542,12 +581,7 @@ Respond in JSON:
         
         self.refinements.append(refinement)
         
-        self._history.append({
-            "stage": "refinement",
-            "input": refine_prompt,
-            "output": result.text,
-            "tokens": result.tokens
-        })
+        self._record_history("refinement", result.tokens)
         
         return refinement
     
@@ -673,12 +707,7 @@ Respond in JSON:
             )
         
         self.argument = argument
-        self._history.append({
-            "stage": "argument",
-            "input": argue_prompt,
-            "output": result.text,
-            "tokens": result.tokens
-        })
+        self._record_history("argument", result.tokens)
         
         return argument
     
@@ -734,12 +763,7 @@ Respond in JSON:
         
         draft = WorkerDraft.from_json(result.text)
         self.current_draft = draft
-        self._history.append({
-            "stage": "diversify",
-            "input": diversify_prompt,
-            "output": result.text,
-            "tokens": result.tokens
-        })
+        self._record_history("diversify", result.tokens)
         
         return draft
     
@@ -832,12 +856,7 @@ Respond in JSON:
 
         normalized["raw_text"] = result.text
         
-        self._history.append({
-            "stage": "collaboration",
-            "input": collab_prompt,
-            "output": result.text,
-            "tokens": result.tokens
-        })
+        self._record_history("collaboration", result.tokens)
         
         return normalized
     
@@ -877,103 +896,66 @@ Respond in JSON:
         
         try:
             data = json.loads(result.text)
+            axioms = data.get("axioms")
             
             # Handle nested JSON - sometimes the model puts JSON inside a string field
             # This often happens with escaped JSON strings (e.g., "{\\n    \"axioms\": ...")
             if isinstance(data.get("theory_contribution"), str):
                 theory_str = data["theory_contribution"].strip()
-                if theory_str.startswith("{") or theory_str.startswith('"') and theory_str.startswith('"{'):
+                if theory_str.startswith(("{", '"{')):
                     try:
                         # Try parsing directly
                         nested = json.loads(theory_str)
                         # If the nested JSON has axioms, use those
-                        if nested.get("axioms") and (not data.get("axioms") or len(data.get("axioms", [])) == 0):
-                            data["axioms"] = nested["axioms"]
+                        if nested.get("axioms") and not axioms:
+                            axioms = data["axioms"] = nested["axioms"]
                         if nested.get("theory_contribution") and isinstance(nested.get("theory_contribution"), str):
                             data["theory_contribution"] = nested["theory_contribution"]
                     except json.JSONDecodeError:
                         # Try unescaping first (handle \\n -> \n)
                         try:
-                            import codecs
-                            unescaped = codecs.decode(theory_str, 'unicode_escape')
+                            unescaped = _unescape(theory_str)
                             nested = json.loads(unescaped)
-                            if nested.get("axioms") and (not data.get("axioms") or len(data.get("axioms", [])) == 0):
-                                data["axioms"] = nested["axioms"]
+                            if nested.get("axioms") and not axioms:
+                                axioms = data["axioms"] = nested["axioms"]
                             if nested.get("theory_contribution") and isinstance(nested.get("theory_contribution"), str):
                                 data["theory_contribution"] = nested["theory_contribution"]
                         except (json.JSONDecodeError, UnicodeDecodeError):
                             # Try regex extraction as last resort
-                            import re
-                            json_match = re.search(r'\{[\s\S]*?"axioms"[\s\S]*?\}', theory_str)
+                            json_match = _AXIOMS_RE.search(theory_str)
                             if json_match:
                                 try:
                                     parsed = json.loads(json_match.group())
-                                    if parsed.get("axioms") and (not data.get("axioms") or len(data.get("axioms", [])) == 0):
-                                        data["axioms"] = parsed["axioms"]
+                                    if parsed.get("axioms") and not axioms:
+                                        axioms = data["axioms"] = parsed["axioms"]
                                 except json.JSONDecodeError:
                                     pass
-                    
-            # Also check raw_text for axioms if axioms is still empty
-            if not data.get("axioms") or len(data.get("axioms", [])) == 0:
-                # Check if raw_text contains axioms (sometimes it's stored there)
-                raw_text_str = str(result.text)
-                if '"axioms"' in raw_text_str:
-                    try:
-                        # Try parsing the entire raw text
-                        nested = json.loads(raw_text_str)
-                        if nested.get("axioms"):
-                            data["axioms"] = nested["axioms"]
-                    except json.JSONDecodeError:
-                        # Try regex extraction from raw text
-                        import re
-                        json_match = re.search(r'\{[\s\S]*?"axioms"[\s\S]*?\}', raw_text_str)
-                        if json_match:
-                            try:
-                                parsed = json.loads(json_match.group())
-                                if parsed.get("axioms"):
-                                    data["axioms"] = parsed["axioms"]
-                            except json.JSONDecodeError:
-                                pass
                         
         except json.JSONDecodeError:
-            # Try to extract axioms from raw text anyway
-            data = {
-                "axioms": [],
-                "theory_contribution": result.text,
-                "raw_text": result.text
-            }
-            
-            # Try to find JSON in the raw text using regex
-            import re
-            json_match = re.search(r'\{[\s\S]*?"axioms"[\s\S]*?\}', result.text)
+            # Try to find JSON with axioms in the raw text
+            parsed = {}
+            json_match = _AXIOMS_RE.search(result.text)
             if json_match:
                 try:
                     parsed = json.loads(json_match.group())
-                    if parsed.get("axioms"):
-                        data["axioms"] = parsed["axioms"]
-                    if parsed.get("theory_contribution"):
-                        data["theory_contribution"] = parsed["theory_contribution"]
                 except json.JSONDecodeError:
-                    # Last resort: try unescaping and parsing
+                    # Last resort: try unescaping and parsing (axioms only)
                     try:
-                        import codecs
-                        unescaped = codecs.decode(json_match.group(), 'unicode_escape')
-                        parsed = json.loads(unescaped)
-                        if parsed.get("axioms"):
-                            data["axioms"] = parsed["axioms"]
+                        parsed = {"axioms": json.loads(_unescape(json_match.group())).get("axioms")}
                     except (json.JSONDecodeError, UnicodeDecodeError):
                         pass
+            
+            data = {
+                "axioms": parsed.get("axioms") or [],
+                "theory_contribution": parsed.get("theory_contribution") or result.text,
+                "raw_text": result.text
+            }
         
         # Ensure raw_text is always set
         if "raw_text" not in data:
             data["raw_text"] = result.text
         
-        self._history.append({
-            "stage": "axiom_analysis",
-            "input": full_prompt,
-            "output": result.text,
-            "tokens": result.tokens
-        })
+        self._record_history("axiom_analysis", result.tokens, in_context=False)
         
         return data
     
@@ -981,8 +963,8 @@ Respond in JSON:
         """Get current worker state for serialization."""
         return {
             "worker_id": self.worker_id,
-            "persona_id": self.persona.id if self.persona else None,
-            "persona_name": self.persona.name if self.persona else None,
+            "persona_id": self.persona_id,
+            "persona_name": self.persona_name,
             "display_id": self.display_id,
             "model": self.model,
             "current_draft": self.current_draft.to_dict() if self.current_draft else None,
@@ -7,9 +7,16 @@ import os
 import yaml
 import psutil
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _total_ram_gb() -> float:
+    """Total system RAM in GB (fixed for the life of the process)."""
+    return psutil.virtual_memory().total / (1024 ** 3)
 
 
 class RAMMode(Enum):
@@ -18,7 +25,7 @@ class RAMMode(Enum):
     MODE_32GB = "32GB"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerConfig:
     """Worker agent configuration."""
     count: int
@@ -27,7 +34,7 @@ class WorkerConfig:
     max_output_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SynthesizerConfig:
     """Synthesizer agent configuration."""
     model: str
@@ -35,7 +42,7 @@ class SynthesizerConfig:
     max_output_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenLimits:
     """Token limits for various stages."""
     worker_draft: int
@@ -45,15 +52,16 @@ class TokenLimits:
     argumentation: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryConfig:
     """Memory management configuration."""
     system_reserved_gb: int
     model_unloading: str
     max_ram_usage_percent: int
+    max_parallel_requests: int = 1  # Worker calls sent to Ollama at once (each needs its own KV cache)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Pipeline execution configuration."""
     refinement_loops: int
@@ -64,16 +72,17 @@ class PipelineConfig:
     refinement_similarity_threshold: float = 0.92
 
 
-@dataclass
+@dataclass(slots=True)
 class OllamaConfig:
     """Ollama runtime configuration."""
     base_url: str
     timeout: int
     retry_attempts: int
     retry_delay: int
+    keep_alive: str = "30m"  # How long Ollama keeps an idle model (and its prompt cache) loaded
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeConfig:
     """Complete mode-specific configuration."""
     mode_name: str
@@ -85,30 +94,42 @@ class ModeConfig:
     pipeline: PipelineConfig
 
 
-@dataclass 
+@dataclass(slots=True)
 class AppConfig:
     """Complete application configuration."""
     mode: RAMMode
     mode_config: ModeConfig
     ollama: OllamaConfig
-    default_personas: list
+    default_personas: Tuple[Dict[str, Any], ...]
     base_path: Path = field(default_factory=lambda: Path.cwd())
     
+    # Derived paths, built once from base_path instead of on every access
+    _data_dir: Path = field(init=False, repr=False, compare=False)
+    _sessions_dir: Path = field(init=False, repr=False, compare=False)
+    _personas_file: Path = field(init=False, repr=False, compare=False)
+    _raw_imports_dir: Path = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._data_dir = self.base_path / "data"
+        self._sessions_dir = self._data_dir / "sessions"
+        self._personas_file = self._data_dir / "personas" / "personas.json"
+        self._raw_imports_dir = self._data_dir / "personas" / "raw_imports"
+    
     @property
     def data_dir(self) -> Path:
-        return self.base_path / "data"
+        return self._data_dir
     
     @property
     def sessions_dir(self) -> Path:
-        return self.data_dir / "sessions"
+        return self._sessions_dir
     
     @property
     def personas_file(self) -> Path:
-        return self.data_dir / "personas" / "personas.json"
+        return self._personas_file
     
     @property
     def raw_imports_dir(self) -> Path:
-        return self.data_dir / "personas" / "raw_imports"
+        return self._raw_imports_dir
 
 
 class ConfigManager:
@@ -125,6 +146,7 @@ class ConfigManager:
         self.base_path = base_path or Path.cwd()
         self.config_dir = self.base_path / "config"
         self._config: Optional[AppConfig] = None
+        self._summary_cache: Optional[Dict[str, Any]] = None
     
     def detect_ram_mode(self) -> RAMMode:
         """
@@ -140,8 +162,7 @@ class ConfigManager:
             return RAMMode.MODE_16GB
         
         # Auto-detect from system RAM
-        total_ram_gb = psutil.virtual_memory().total / (1024 ** 3)
-        if total_ram_gb >= 28:  # Allow some margin
+        if _total_ram_gb() >= 28:  # Allow some margin
             return RAMMode.MODE_32GB
         else:
             return RAMMode.MODE_16GB
@@ -196,11 +217,12 @@ class ConfigManager:
         ollama_config = OllamaConfig(**default["ollama"])
         
         # Create AppConfig
+        self._summary_cache = None
         self._config = AppConfig(
             mode=mode,
             mode_config=mode_config,
             ollama=ollama_config,
-            default_personas=default.get("default_personas", []),
+            default_personas=tuple(default.get("default_personas") or ()),
             base_path=self.base_path
         )
         
@@ -214,17 +236,21 @@ class ConfigManager:
         return self._config
     
     def get_mode_summary(self) -> Dict[str, Any]:
-        """Get a summary of current mode configuration for the UI."""
+        """Get a summary of current mode configuration for the UI (cached until reload)."""
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
         config = self.config
-        return {
+        self._summary_cache = {
             "mode": config.mode.value,
             "description": config.mode_config.description,
             "worker_count": config.mode_config.workers.count,
             "worker_model": config.mode_config.workers.model,
             "synthesizer_model": config.mode_config.synthesizer.model,
             "refinement_loops": config.mode_config.pipeline.refinement_loops,
-            "system_ram_gb": round(psutil.virtual_memory().total / (1024 ** 3), 1)
+            "system_ram_gb": round(_total_ram_gb(), 1)
         }
+        return self._summary_cache
     
     def switch_mode(self, new_mode: RAMMode) -> AppConfig:
         """Switch to a different RAM mode."""
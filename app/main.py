@@ -4,12 +4,36 @@ Entry point for the web server and API routes.
 """
 
 import os
-import json
+import gzip
+import queue
+import threading
+import time
+import zlib
 from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple, Type, TypeVar
 from flask import Flask, render_template, jsonify, request, Response
 from flask_cors import CORS
+from pydantic import BaseModel, ValidationError
+from werkzeug.exceptions import BadRequest, HTTPException, RequestEntityTooLarge
+
+try:
+    import msgpack
+except ImportError:  # Optional - /full-state is served as JSON only
+    msgpack = None
 
 from .config import get_config_manager, get_config, RAMMode
+from .models import OllamaRuntime
+from .orchestrator import Orchestrator
+from .personas import PersonaManager
+from .schemas import StartSessionRequest, VoteRequest
+from .utils import MemoryMonitor, SessionStore
+from .utils.serialization import dumps, loads, JSONDecodeError
+
+
+# Default project root and its asset folders, resolved once at import
+_DEFAULT_BASE_PATH = Path(__file__).parent.parent
+_DEFAULT_TEMPLATE_FOLDER = str(_DEFAULT_BASE_PATH / "templates")
+_DEFAULT_STATIC_FOLDER = str(_DEFAULT_BASE_PATH / "static")
 
 
 def create_app(config_path: str = None) -> Flask:
@@ -25,8 +49,12 @@ def create_app(config_path: str = None) -> Flask:
     # Determine base path
     if config_path:
         base_path = Path(config_path)
+        template_folder = str(base_path / "templates")
+        static_folder = str(base_path / "static")
     else:
-        base_path = Path(__file__).parent.parent
+        base_path = _DEFAULT_BASE_PATH
+        template_folder = _DEFAULT_TEMPLATE_FOLDER
+        static_folder = _DEFAULT_STATIC_FOLDER
     
     # Initialize config manager
     config_manager = get_config_manager(base_path)
@@ -35,16 +63,23 @@ def create_app(config_path: str = None) -> Flask:
     # Create Flask app
     app = Flask(
         __name__,
-        template_folder=str(base_path / "templates"),
-        static_folder=str(base_path / "static")
+        template_folder=template_folder,
+        static_folder=static_folder
     )
     
     # Enable CORS for development
     CORS(app)
     
+    # Reject oversized request bodies before they are read (API payloads are small)
+    app.config["MAX_CONTENT_LENGTH"] = 1024 * 1024
+    
     # Store config manager in app context
     app.config["AI_COUNCIL_CONFIG_MANAGER"] = config_manager
     app.config["AI_COUNCIL_BASE_PATH"] = base_path
+    app.config["AI_COUNCIL_PERSONA_MANAGER"] = PersonaManager(base_path)
+    app.config["AI_COUNCIL_OLLAMA_RUNTIME"] = OllamaRuntime(config.ollama)
+    # Expired or evicted sessions release their pooled Ollama connections
+    app.config["sessions"] = SessionStore(on_evict=lambda orchestrator: orchestrator.close())
     
     # Ensure data directories exist
     ensure_data_directories(base_path)
@@ -55,20 +90,264 @@ def create_app(config_path: str = None) -> Flask:
     return app
 
 
+# Leaf data directories (parents are created along the way)
+_DATA_DIRECTORIES = (
+    ("data", "sessions"),
+    ("data", "personas", "raw_imports"),
+    ("data", "exports")
+)
+
+# Base paths whose data directories were already created by this process
+_prepared_base_paths = set()
+
+
 def ensure_data_directories(base_path: Path):
-    """Ensure all required data directories exist."""
-    directories = [
-        base_path / "data" / "sessions",
-        base_path / "data" / "personas" / "raw_imports",
-        base_path / "data" / "exports"
-    ]
-    for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+    """Ensure all required data directories exist (once per base path)."""
+    if base_path in _prepared_base_paths:
+        return
+    
+    for parts in _DATA_DIRECTORIES:
+        # mkdir tries the leaf first and only walks up when a parent is missing
+        base_path.joinpath(*parts).mkdir(parents=True, exist_ok=True)
+    
+    _prepared_base_paths.add(base_path)
+
+
+# Feedback kind -> (Orchestrator method, ((kwarg, body key, default), ...))
+_FEEDBACK_DISPATCH: Dict[str, Tuple[str, Tuple[Tuple[str, str, Any], ...]]] = {
+    "round": ("submit_round_feedback", (
+        ("round_num", "round", 1),
+        ("worker_feedback", "worker_feedback", None),  # {worker_id: feedback_text}
+        ("skip_to_synthesis", "skip_to_synthesis", False),
+    )),
+    "argument": ("submit_argument_feedback", (
+        ("round_num", "round", 1),
+        ("worker_feedback", "worker_feedback", None),
+        ("skip_to_voting", "skip_to_voting", False),
+    )),
+    "collab": ("submit_collab_feedback", (
+        ("round_num", "round", 1),
+        ("worker_feedback", "worker_feedback", None),
+        ("skip_to_synthesis", "skip_to_synthesis", False),
+    )),
+    "final": ("submit_final_feedback", (
+        ("feedback", "feedback", ""),
+    )),
+}
+
+
+RequestModel = TypeVar("RequestModel", bound=BaseModel)
+
+# Server-Sent Events frame delimiters
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def _sse(event: Dict[str, Any]) -> bytes:
+    """Encode an event as a Server-Sent Events data frame."""
+    return b"".join((_SSE_PREFIX, dumps(event), _SSE_SUFFIX))
+
+
+# Fixed end-of-stream frame, encoded once
+_SSE_COMPLETE = _sse({"type": "complete"})
+
+# SSE comment sent while the pipeline is busy, so proxies don't drop the stream
+_SSE_KEEPALIVE = b": keepalive\n\n"
+_SSE_KEEPALIVE_SECONDS = 15
+
+# Probes hit /api/health every few seconds; reuse the Ollama check this long
+_HEALTH_CACHE_SECONDS = 2.0
+
+# Frames buffered ahead of a slow client before the producer waits
+_SSE_QUEUE_SIZE = 64
+
+_STREAM_END = object()
+
+
+def _frames_in_background(events: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Drive an event generator on a worker thread and yield its encoded frames.
+    
+    Model calls and event encoding keep running while earlier frames are
+    written to the client. Exceptions raised by the generator are re-raised
+    here, and the worker stops once the client goes away.
+    
+    Args:
+        events: Orchestrator event generator.
+    
+    Yields:
+        SSE frames, plus keepalive comments while waiting for the next event.
+    """
+    frames: "queue.Queue[Any]" = queue.Queue(maxsize=_SSE_QUEUE_SIZE)
+    stopped = threading.Event()
+    
+    def put(item: Any) -> bool:
+        """Queue an item, giving up if the consumer has stopped."""
+        while not stopped.is_set():
+            try:
+                frames.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for event in events:
+                if not put(_sse(event)):
+                    break
+            else:
+                put(_STREAM_END)
+        except Exception as e:
+            put(e)
+        finally:
+            events.close()
+    
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            try:
+                item = frames.get(timeout=_SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield _SSE_KEEPALIVE
+                continue
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+
+
+# Responses smaller than this aren't worth compressing
+_GZIP_MIN_BYTES = 1024
+
+
+def _accepts_gzip() -> bool:
+    """Check whether the current client accepts gzip-encoded responses."""
+    return "gzip" in request.accept_encodings
+
+
+def _gzip_frames(frames: Iterator[bytes]) -> Iterator[bytes]:
+    """Gzip a frame stream, flushing after every frame so events aren't delayed."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    for frame in frames:
+        yield compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _sse_response(frames: Iterator[bytes]) -> Response:
+    """
+    Build a streaming SSE response.
+    
+    Frames are already encoded bytes, so they are passed straight through to
+    the WSGI server instead of being re-encoded chunk by chunk. The stream is
+    gzipped when the client supports it.
+    """
+    gzipped = _accepts_gzip()
+    response = Response(
+        _gzip_frames(frames) if gzipped else frames,
+        mimetype="text/event-stream",
+        headers=_SSE_HEADERS,
+        direct_passthrough=True
+    )
+    if gzipped:
+        response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _maybe_gzip(response: Response) -> Response:
+    """Gzip a buffered response body if it is large and the client accepts it."""
+    if response.status_code == 200 and _accepts_gzip():
+        body = response.get_data()
+        if len(body) >= _GZIP_MIN_BYTES:
+            response.set_data(gzip.compress(body, compresslevel=6))
+            response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _conditional_json(payload: Dict[str, Any]) -> Response:
+    """
+    Build a JSON response tagged with a content ETag.
+    
+    Clients re-polling with a matching If-None-Match get an empty 304 instead
+    of the full body.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _read_json() -> Dict[str, Any]:
+    """
+    Parse the request body as a JSON object.
+    
+    The body is read once without caching it on the request, and decoded with
+    the fast JSON parser. An empty body is treated as an empty object.
+    
+    Raises:
+        BadRequest: If the body is not a JSON object.
+    """
+    body = request.get_data(cache=False)
+    if not body:
+        return {}
+    try:
+        data = loads(body)
+    except JSONDecodeError:
+        raise BadRequest("Request body is not valid JSON")
+    if not isinstance(data, dict):
+        raise BadRequest("Request body must be a JSON object")
+    return data
+
+
+def _read_model(model: Type[RequestModel]) -> RequestModel:
+    """
+    Parse and validate the request body against a schema in one pass.
+    
+    Raises:
+        BadRequest: If the body is not valid JSON or doesn't match the schema.
+    """
+    body = request.get_data(cache=False) or b"{}"
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in err['loc']) or 'body'}: {err['msg']}"
+            for err in e.errors()
+        )
+        raise BadRequest(f"Invalid request body: {problems}")
 
 
 def register_routes(app: Flask):
     """Register all application routes."""
     
+    @app.errorhandler(BadRequest)
+    @app.errorhandler(RequestEntityTooLarge)
+    def handle_request_error(e: HTTPException):
+        """Report malformed or oversized request bodies as JSON."""
+        return jsonify({"error": e.description}), e.code
+    
+    # Created once in create_app; bind it here rather than looking it up per request
+    sessions: SessionStore = app.config["sessions"]
+    
+    def _get_session(session_id: str):
+        """Look up a session's orchestrator (None if unknown or expired)."""
+        return sessions.get(session_id)
+    
+    # Last Ollama probe result; concurrent probes wait on the lock and reuse it
+    health_cache: Dict[str, Any] = {"checked_at": float("-inf"), "ollama": "unknown"}
+    health_lock = threading.Lock()
+    
     # =========================================================================
     # Page Routes
     # =========================================================================
@@ -86,12 +365,12 @@ def register_routes(app: Flask):
     def get_configuration():
         """Get current configuration summary."""
         config_manager = app.config["AI_COUNCIL_CONFIG_MANAGER"]
-        return jsonify(config_manager.get_mode_summary())
+        return _conditional_json(config_manager.get_mode_summary())
     
     @app.route("/api/config/mode", methods=["POST"])
     def set_mode():
         """Switch RAM mode."""
-        data = request.get_json()
+        data = _read_json()
         mode_str = data.get("mode", "").upper()
         
         if mode_str not in ["16GB", "32GB"]:
@@ -113,20 +392,16 @@ def register_routes(app: Flask):
     @app.route("/api/personas", methods=["GET"])
     def get_personas():
         """Get all available personas."""
-        from .personas import PersonaManager
-        base_path = app.config["AI_COUNCIL_BASE_PATH"]
-        manager = PersonaManager(base_path)
+        manager = app.config["AI_COUNCIL_PERSONA_MANAGER"]
         personas = manager.get_all_personas()
         return jsonify({"personas": personas})
     
     @app.route("/api/personas", methods=["POST"])
     def create_persona():
         """Create a new persona."""
-        from .personas import PersonaManager
-        base_path = app.config["AI_COUNCIL_BASE_PATH"]
-        manager = PersonaManager(base_path)
+        manager = app.config["AI_COUNCIL_PERSONA_MANAGER"]
         
-        data = request.get_json()
+        data = _read_json()
         try:
             persona = manager.create_persona(
                 name=data["name"],
@@ -141,11 +416,9 @@ def register_routes(app: Flask):
     @app.route("/api/personas/<persona_id>", methods=["PUT"])
     def update_persona(persona_id: str):
         """Update an existing persona."""
-        from .personas import PersonaManager
-        base_path = app.config["AI_COUNCIL_BASE_PATH"]
-        manager = PersonaManager(base_path)
+        manager = app.config["AI_COUNCIL_PERSONA_MANAGER"]
         
-        data = request.get_json()
+        data = _read_json()
         try:
             persona = manager.update_persona(persona_id, data)
             if persona:
@@ -157,9 +430,7 @@ def register_routes(app: Flask):
     @app.route("/api/personas/<persona_id>", methods=["DELETE"])
     def delete_persona(persona_id: str):
         """Delete a persona."""
-        from .personas import PersonaManager
-        base_path = app.config["AI_COUNCIL_BASE_PATH"]
-        manager = PersonaManager(base_path)
+        manager = app.config["AI_COUNCIL_PERSONA_MANAGER"]
         
         if manager.delete_persona(persona_id):
             return jsonify({"success": True})
@@ -172,49 +443,36 @@ def register_routes(app: Flask):
     @app.route("/api/session/start", methods=["POST"])
     def start_session():
         """Start a new council session."""
-        from .orchestrator import Orchestrator
         base_path = app.config["AI_COUNCIL_BASE_PATH"]
         config_manager = app.config["AI_COUNCIL_CONFIG_MANAGER"]
         
-        data = request.get_json()
-        prompt = data.get("prompt", "")
-        persona_assignments = data.get("personas", {})
-        debate_rounds = data.get("debate_rounds")  # Optional, defaults to config value
-        argument_rounds = data.get("argument_rounds")  # Optional, defaults to config value
-        collaboration_rounds = data.get("collaboration_rounds")  # Optional, defaults to config value
-        axiom_rounds = data.get("axiom_rounds")  # Optional, defaults to config value
-        worker_count = data.get("worker_count")  # Optional, UI override (2-4 workers)
-        worker_max_tokens = data.get("worker_max_tokens")  # Optional, for session override
-        synth_max_tokens = data.get("synth_max_tokens")  # Optional, for session override
-        worker_context_window = data.get("worker_context_window")  # Optional, UI override (1K-32K)
-        synth_context_window = data.get("synth_context_window")  # Optional, UI override (1K-32K)
-        
-        if not prompt:
+        # Optional round/token/context fields default to config values when omitted
+        req = _read_model(StartSessionRequest)
+        
+        if not req.prompt:
             return jsonify({"error": "Prompt is required"}), 400
         
         # Create orchestrator with potentially overridden token settings (UI overrides config)
         orchestrator = Orchestrator(
             base_path, 
             config_manager.config,
-            worker_max_tokens=worker_max_tokens,
-            synth_max_tokens=synth_max_tokens,
-            worker_context_window=worker_context_window,
-            synth_context_window=synth_context_window
+            worker_max_tokens=req.worker_max_tokens,
+            synth_max_tokens=req.synth_max_tokens,
+            worker_context_window=req.worker_context_window,
+            synth_context_window=req.synth_context_window
         )
         session_id = orchestrator.create_session(
-            prompt, 
-            persona_assignments,
-            debate_rounds=debate_rounds,
-            argument_rounds=argument_rounds,
-            collaboration_rounds=collaboration_rounds,
-            axiom_rounds=axiom_rounds,
-            worker_count=worker_count
+            req.prompt, 
+            req.personas,
+            debate_rounds=req.debate_rounds,
+            argument_rounds=req.argument_rounds,
+            collaboration_rounds=req.collaboration_rounds,
+            axiom_rounds=req.axiom_rounds,
+            worker_count=req.worker_count
         )
         
         # Store orchestrator for this session
-        if "sessions" not in app.config:
-            app.config["sessions"] = {}
-        app.config["sessions"][session_id] = orchestrator
+        sessions.add(session_id, orchestrator)
         
         return jsonify({
             "session_id": session_id,
@@ -230,8 +488,7 @@ def register_routes(app: Flask):
     @app.route("/api/session/<session_id>/run", methods=["GET"])
     def run_session(session_id: str):
         """Run the full pipeline for a session (SSE stream)."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
@@ -239,55 +496,52 @@ def register_routes(app: Flask):
         def generate():
             """Generate SSE events for pipeline progress."""
             try:
-                for event in orchestrator.run_pipeline():
-                    yield f"data: {json.dumps(event)}\n\n"
+                yield from _frames_in_background(orchestrator.run_pipeline())
             except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                yield _sse({"type": "error", "message": str(e)})
             finally:
-                yield f"data: {json.dumps({'type': 'complete'})}\n\n"
-        
-        return Response(
-            generate(),
-            mimetype="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"
-            }
-        )
+                yield _SSE_COMPLETE
+        
+        return _sse_response(generate())
     
     @app.route("/api/session/<session_id>/status", methods=["GET"])
     def get_session_status(session_id: str):
         """Get current session status."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
         
-        return jsonify(orchestrator.get_status())
+        return _conditional_json(orchestrator.get_status())
     
     @app.route("/api/session/<session_id>/full-state", methods=["GET"])
     def get_session_full_state(session_id: str):
         """Get complete session state for UI restoration after page reload."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
         
-        return jsonify(orchestrator.get_full_state())
+        state = orchestrator.get_full_state()
+        
+        # Clients that explicitly ask for msgpack get the compact binary form
+        best = request.accept_mimetypes.best_match(["application/json", "application/msgpack"])
+        if msgpack is not None and best == "application/msgpack":
+            response = Response(msgpack.packb(state, use_bin_type=True), mimetype="application/msgpack")
+        else:
+            response = jsonify(state)
+        response.vary.add("Accept")
+        return _maybe_gzip(response)
     
     @app.route("/api/session/<session_id>/swap-persona", methods=["POST"])
     def swap_worker_persona(session_id: str):
         """Swap a worker's persona mid-session."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
         
-        data = request.get_json()
+        data = _read_json()
         worker_id = data.get("worker_id")
         new_persona_id = data.get("persona_id")
         action = data.get("action", "restart")  # keep_all, archive, restart
@@ -304,8 +558,7 @@ def register_routes(app: Flask):
     @app.route("/api/session/<session_id>/diversify", methods=["GET"])
     def diversify_workers(session_id: str):
         """Diversify workers - let them see each other's proposals (SSE stream)."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
@@ -313,98 +566,49 @@ def register_routes(app: Flask):
         def generate():
             """Generate SSE events for diversify progress."""
             try:
-                for event in orchestrator.diversify_workers():
-                    yield f"data: {json.dumps(event)}\n\n"
+                yield from _frames_in_background(orchestrator.diversify_workers())
             except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-        
-        return Response(
-            generate(),
-            mimetype="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"
-            }
-        )
-    
-    @app.route("/api/session/<session_id>/round-feedback", methods=["POST"])
-    def submit_round_feedback(session_id: str):
-        """Submit feedback for a specific debate round."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+                yield _sse({"type": "error", "message": str(e)})
         
-        if not orchestrator:
-            return jsonify({"error": "Session not found"}), 404
-        
-        data = request.get_json()
-        round_num = data.get("round", 1)
-        worker_feedback = data.get("worker_feedback", {})  # {worker_id: feedback_text}
-        skip_to_synthesis = data.get("skip_to_synthesis", False)
-        
-        try:
-            result = orchestrator.submit_round_feedback(
-                round_num=round_num,
-                worker_feedback=worker_feedback,
-                skip_to_synthesis=skip_to_synthesis
-            )
-            return jsonify(result)
-        except Exception as e:
-            return jsonify({"error": str(e)}), 400
+        return _sse_response(generate())
     
-    @app.route("/api/session/<session_id>/argument-feedback", methods=["POST"])
-    def submit_argument_feedback(session_id: str):
-        """Submit feedback for a specific argumentation round."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+    @app.route("/api/session/<session_id>/feedback/<kind>", methods=["POST"])
+    def submit_feedback(session_id: str, kind: str):
+        """Submit round, argumentation, collaboration or final-output feedback."""
+        handler = _FEEDBACK_DISPATCH.get(kind)
+        if handler is None:
+            return jsonify({"error": f"Unknown feedback kind: {kind}"}), 404
         
-        if not orchestrator:
-            return jsonify({"error": "Session not found"}), 404
-        
-        data = request.get_json()
-        round_num = data.get("round", 1)
-        worker_feedback = data.get("worker_feedback", {})  # {worker_id: feedback_text}
-        skip_to_voting = data.get("skip_to_voting", False)
-        
-        try:
-            result = orchestrator.submit_argument_feedback(
-                round_num=round_num,
-                worker_feedback=worker_feedback,
-                skip_to_voting=skip_to_voting
-            )
-            return jsonify(result)
-        except Exception as e:
-            return jsonify({"error": str(e)}), 400
-    
-    @app.route("/api/session/<session_id>/collab-feedback", methods=["POST"])
-    def submit_collab_feedback(session_id: str):
-        """Submit feedback for a specific collaboration round."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
         
-        data = request.get_json()
-        round_num = data.get("round", 1)
-        worker_feedback = data.get("worker_feedback", {})  # {worker_id: feedback_text}
-        skip_to_synthesis = data.get("skip_to_synthesis", False)
+        method_name, params = handler
+        data = _read_json()
+        kwargs = {name: data.get(key, default) for name, key, default in params}
         
         try:
-            result = orchestrator.submit_collab_feedback(
-                round_num=round_num,
-                worker_feedback=worker_feedback,
-                skip_to_synthesis=skip_to_synthesis
-            )
+            result = getattr(orchestrator, method_name)(**kwargs)
             return jsonify(result)
         except Exception as e:
             return jsonify({"error": str(e)}), 400
     
+    # Legacy per-kind URLs keep their old endpoint names; sharing the generic
+    # endpoint would make werkzeug redirect /feedback/<kind> to them
+    for kind in _FEEDBACK_DISPATCH:
+        app.add_url_rule(
+            f"/api/session/<session_id>/{kind}-feedback",
+            endpoint=f"submit_{kind}_feedback",
+            view_func=submit_feedback,
+            methods=["POST"],
+            defaults={"kind": kind}
+        )
+    
     @app.route("/api/session/<session_id>/continue", methods=["GET"])
     def continue_session(session_id: str):
         """Continue the pipeline after round feedback (SSE stream)."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
@@ -412,22 +616,13 @@ def register_routes(app: Flask):
         def generate():
             """Generate SSE events for pipeline continuation."""
             try:
-                for event in orchestrator.continue_pipeline():
-                    yield f"data: {json.dumps(event)}\n\n"
+                yield from _frames_in_background(orchestrator.continue_pipeline())
             except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                yield _sse({"type": "error", "message": str(e)})
             finally:
-                yield f"data: {json.dumps({'type': 'complete'})}\n\n"
-        
-        return Response(
-            generate(),
-            mimetype="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"
-            }
-        )
+                yield _SSE_COMPLETE
+        
+        return _sse_response(generate())
     
     # =========================================================================
     # Voting API
@@ -436,30 +631,22 @@ def register_routes(app: Flask):
     @app.route("/api/session/<session_id>/vote", methods=["POST"])
     def submit_vote(session_id: str):
         """Submit user vote for candidates with comprehensive feedback."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
         
-        data = request.get_json()
-        votes = data.get("votes", {})  # {candidate_id: rank}
-        candidate_feedback = data.get("candidate_feedback", {})  # {candidate_id: feedback_text}
-        overall_feedback = data.get("overall_feedback", "")  # General session feedback
-        worker_feedback = data.get("worker_feedback", {})  # {worker_id: feedback_text}
-        synthesizer_feedback = data.get("synthesizer_feedback", "")  # Feedback on synthesizer
-        prompt_rating = data.get("prompt_rating", 0)  # Prompt quality rating (1-5, 0=skip)
-        prompt_feedback = data.get("prompt_feedback", "")  # Feedback on prompt quality
+        req = _read_model(VoteRequest)
         
         try:
             result = orchestrator.submit_user_votes(
-                votes=votes,
-                candidate_feedback=candidate_feedback,
-                overall_feedback=overall_feedback,
-                worker_feedback=worker_feedback,
-                synthesizer_feedback=synthesizer_feedback,
-                prompt_rating=prompt_rating,
-                prompt_feedback=prompt_feedback
+                votes=req.votes,
+                candidate_feedback=req.candidate_feedback,
+                overall_feedback=req.overall_feedback,
+                worker_feedback=req.worker_feedback,
+                synthesizer_feedback=req.synthesizer_feedback,
+                prompt_rating=req.prompt_rating,
+                prompt_feedback=req.prompt_feedback
             )
             return jsonify(result)
         except Exception as e:
@@ -468,8 +655,7 @@ def register_routes(app: Flask):
     @app.route("/api/session/<session_id>/finalize", methods=["GET"])
     def finalize_session(session_id: str):
         """Finalize session with axiom analysis and final output (SSE stream)."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+        orchestrator = _get_session(session_id)
         
         if not orchestrator:
             return jsonify({"error": "Session not found"}), 404
@@ -479,38 +665,20 @@ def register_routes(app: Flask):
         def generate():
             """Generate SSE events for finalize progress."""
             try:
-                for event in orchestrator.finalize(run_axioms=run_axioms):
-                    yield f"data: {json.dumps(event)}\n\n"
+                yield from _frames_in_background(orchestrator.finalize(run_axioms=run_axioms))
             except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-        
-        return Response(
-            generate(),
-            mimetype="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"
-            }
-        )
-    
-    @app.route("/api/session/<session_id>/final-feedback", methods=["POST"])
-    def submit_final_feedback(session_id: str):
-        """Submit feedback on the final output (for logging only)."""
-        sessions = app.config.get("sessions", {})
-        orchestrator = sessions.get(session_id)
+                yield _sse({"type": "error", "message": str(e)})
         
-        if not orchestrator:
+        return _sse_response(generate())
+    
+    @app.route("/api/session/<session_id>/close", methods=["POST"])
+    def close_session(session_id: str):
+        """Close a session and release its orchestrator."""
+        orchestrator = sessions.pop(session_id)
+        if orchestrator is None:
             return jsonify({"error": "Session not found"}), 404
-        
-        data = request.get_json()
-        feedback = data.get("feedback", "")
-        
-        try:
-            result = orchestrator.submit_final_feedback(feedback)
-            return jsonify(result)
-        except Exception as e:
-            return jsonify({"error": str(e)}), 400
+        orchestrator.close()
+        return jsonify({"success": True})
     
     # =========================================================================
     # Memory API
@@ -519,7 +687,6 @@ def register_routes(app: Flask):
     @app.route("/api/system/memory", methods=["GET"])
     def get_memory_status():
         """Get current memory usage status."""
-        from .utils import MemoryMonitor
         monitor = MemoryMonitor()
         return jsonify(monitor.get_status())
     
@@ -530,18 +697,23 @@ def register_routes(app: Flask):
     @app.route("/api/health", methods=["GET"])
     def health_check():
         """Health check endpoint."""
-        from .models import OllamaRuntime
         config_manager = app.config["AI_COUNCIL_CONFIG_MANAGER"]
         
-        ollama_status = "unknown"
-        try:
-            runtime = OllamaRuntime(config_manager.config.ollama)
-            if runtime.check_health():
-                ollama_status = "healthy"
+        with health_lock:
+            if time.monotonic() - health_cache["checked_at"] < _HEALTH_CACHE_SECONDS:
+                ollama_status = health_cache["ollama"]
             else:
-                ollama_status = "unhealthy"
-        except Exception:
-            ollama_status = "error"
+                ollama_status = "unknown"
+                try:
+                    runtime = app.config["AI_COUNCIL_OLLAMA_RUNTIME"]
+                    if runtime.check_health():
+                        ollama_status = "healthy"
+                    else:
+                        ollama_status = "unhealthy"
+                except Exception:
+                    ollama_status = "error"
+                health_cache["ollama"] = ollama_status
+                health_cache["checked_at"] = time.monotonic()
         
         return jsonify({
             "status": "healthy",
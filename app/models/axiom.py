@@ -7,12 +7,15 @@ because every statement approximates truth but never IS truth.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from enum import Enum
-import json
+from functools import lru_cache
+from collections import defaultdict
 import hashlib
 
+from ..utils.serialization import dumps, loads
+
 
 class AxiomSourceType(Enum):
     """Who contributed an axiom."""
@@ -21,7 +24,24 @@ class AxiomSourceType(Enum):
     SYNTHESIZER = "synthesizer"
 
 
-@dataclass
+# Plain dict lookup for from_dict; calling the Enum class is much slower per node
+_SOURCE_TYPES = {t.value: t for t in AxiomSourceType}
+
+
+@lru_cache(maxsize=256)
+def _source_dict(source_type: str, source_id: str, persona_id: Optional[str],
+                 persona_name: Optional[str], is_default_persona: bool) -> dict:
+    """Build an AxiomSource dict once per distinct source; nodes mostly repeat a few."""
+    return {
+        "source_type": source_type,
+        "source_id": source_id,
+        "persona_id": persona_id,
+        "persona_name": persona_name,
+        "is_default_persona": is_default_persona
+    }
+
+
+@dataclass(slots=True)
 class AxiomSource:
     """Attribution for who contributed an axiom."""
     source_type: AxiomSourceType     # user | worker | synthesizer
@@ -33,18 +53,19 @@ class AxiomSource:
     is_default_persona: bool = True        # True if no custom persona assigned
     
     def to_dict(self) -> dict:
-        return {
-            "source_type": self.source_type.value,
-            "source_id": self.source_id,
-            "persona_id": self.persona_id,
-            "persona_name": self.persona_name,
-            "is_default_persona": self.is_default_persona
-        }
+        """Convert to dictionary (a copy of the cached dict, safe to modify)."""
+        return dict(_source_dict(
+            self.source_type.value,
+            self.source_id,
+            self.persona_id,
+            self.persona_name,
+            self.is_default_persona
+        ))
     
     @classmethod
     def from_dict(cls, data: dict) -> "AxiomSource":
         return cls(
-            source_type=AxiomSourceType(data["source_type"]),
+            source_type=_SOURCE_TYPES.get(data["source_type"]) or AxiomSourceType(data["source_type"]),
             source_id=data["source_id"],
             persona_id=data.get("persona_id"),
             persona_name=data.get("persona_name"),
@@ -79,7 +100,7 @@ class AxiomSource:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionContext:
     """Session metadata for cross-session analysis."""
     session_id: str
@@ -128,7 +149,7 @@ class SessionContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectedStatement:
     """A statement connected to an axiom."""
     text: str
@@ -151,7 +172,7 @@ class ConnectedStatement:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AxiomNode:
     """Single axiom in the global knowledge graph."""
     # IDENTITY
@@ -192,13 +213,22 @@ class AxiomNode:
     is_shared: bool = False          # Agreed by multiple sources
     shared_by: List[str] = field(default_factory=list)  # Source IDs that share this
     
-    def to_dict(self) -> dict:
+    def to_dict(self, session_dict: Optional[dict] = None) -> dict:
+        """
+        Convert to dictionary.
+        
+        Args:
+            session_dict: Already serialized session, reused instead of
+                converting the same SessionContext again for every node.
+        """
+        if session_dict is None and self.session:
+            session_dict = self.session.to_dict()
         return {
             "axiom_id": self.axiom_id,
             "statement": self.statement,
             "axiom_type": self.axiom_type,
             "source": self.source.to_dict(),
-            "session": self.session.to_dict() if self.session else None,
+            "session": session_dict,
             "round_num": self.round_num,
             "confidence": self.confidence,
             "evidence_strength": self.evidence_strength,
@@ -219,34 +249,54 @@ class AxiomNode:
         }
     
     @classmethod
-    def from_dict(cls, data: dict) -> "AxiomNode":
+    def from_dict(
+        cls,
+        data: dict,
+        shared_session: Optional[Tuple[dict, SessionContext]] = None
+    ) -> "AxiomNode":
+        """
+        Create from dictionary.
+        
+        Args:
+            data: Serialized node.
+            shared_session: (session dict, SessionContext) already loaded for
+                the network; reused when this node's session dict matches.
+        """
+        get = data.get
+        session_data = get("session")
+        if not session_data:
+            session = None
+        elif shared_session and session_data == shared_session[0]:
+            session = shared_session[1]
+        else:
+            session = SessionContext.from_dict(session_data)
         return cls(
             axiom_id=data["axiom_id"],
             statement=data["statement"],
             axiom_type=data["axiom_type"],
             source=AxiomSource.from_dict(data["source"]),
-            session=SessionContext.from_dict(data["session"]) if data.get("session") else None,
-            round_num=data.get("round_num", 1),
-            confidence=data.get("confidence", 0.5),
-            evidence_strength=data.get("evidence_strength", 0.5),
-            depends_on=data.get("depends_on", []),
-            enables=data.get("enables", []),
-            conflicts_with=data.get("conflicts_with", []),
-            supports=data.get("supports", []),
-            connected_statements=[ConnectedStatement.from_dict(s) for s in data.get("connected_statements", [])],
-            theory_contribution=data.get("theory_contribution", ""),
-            theory_id=data.get("theory_id"),
-            potential_biases=data.get("potential_biases", []),
-            vulnerability=data.get("vulnerability", ""),
-            counter_evidence=data.get("counter_evidence", []),
-            centrality_score=data.get("centrality_score", 0.0),
-            cluster_id=data.get("cluster_id"),
-            is_shared=data.get("is_shared", False),
-            shared_by=data.get("shared_by", [])
+            session=session,
+            round_num=get("round_num", 1),
+            confidence=get("confidence", 0.5),
+            evidence_strength=get("evidence_strength", 0.5),
+            depends_on=get("depends_on", []),
+            enables=get("enables", []),
+            conflicts_with=get("conflicts_with", []),
+            supports=get("supports", []),
+            connected_statements=[ConnectedStatement.from_dict(s) for s in get("connected_statements", [])],
+            theory_contribution=get("theory_contribution", ""),
+            theory_id=get("theory_id"),
+            potential_biases=get("potential_biases", []),
+            vulnerability=get("vulnerability", ""),
+            counter_evidence=get("counter_evidence", []),
+            centrality_score=get("centrality_score", 0.0),
+            cluster_id=get("cluster_id"),
+            is_shared=get("is_shared", False),
+            shared_by=get("shared_by", [])
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AxiomEdge:
     """Edge in the axiom network."""
     from_axiom: str
@@ -272,7 +322,7 @@ class AxiomEdge:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Theory:
     """A cluster of related axioms forming a coherent theory."""
     theory_id: str
@@ -310,7 +360,7 @@ class Theory:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AxiomNetwork:
     """Full axiom graph for a session - ready for mind map export."""
     # SESSION INFO
@@ -332,28 +382,27 @@ class AxiomNetwork:
     conflict_clusters: List[dict] = field(default_factory=list)
     # Each: {"axiom_ids": [...], "nature": "contradiction|scope|emphasis", "sources": [...]}
     
-    # SOURCE STATISTICS (for mind map coloring)
-    axioms_by_source: Dict[str, List[str]] = field(default_factory=dict)
-    # {"user": ["ax_001"], "worker_1": ["ax_002"], "synthesizer": ["ax_003"]}
+    # SOURCE STATISTICS (for mind map coloring) - grouped from nodes on demand
     
-    axioms_by_persona: Dict[str, List[str]] = field(default_factory=dict)
-    # {"Analyst": ["ax_002"], "Creative": ["ax_004"], "default": ["ax_005"]}
+    @property
+    def axioms_by_source(self) -> Dict[str, List[str]]:
+        """Axiom IDs per source, e.g. {"user": ["ax_001"], "worker_1": ["ax_002"]}."""
+        grouped = defaultdict(list)
+        for axiom in self.nodes.values():
+            grouped[axiom.source.source_id].append(axiom.axiom_id)
+        return dict(grouped)
+    
+    @property
+    def axioms_by_persona(self) -> Dict[str, List[str]]:
+        """Axiom IDs per persona name, e.g. {"Analyst": ["ax_002"], "default": ["ax_005"]}."""
+        grouped = defaultdict(list)
+        for axiom in self.nodes.values():
+            grouped[axiom.source.persona_name or "default"].append(axiom.axiom_id)
+        return dict(grouped)
     
     def add_axiom(self, axiom: AxiomNode):
-        """Add an axiom and update tracking indices."""
+        """Add an axiom to the network."""
         self.nodes[axiom.axiom_id] = axiom
-        
-        # Update source tracking
-        source_key = axiom.source.source_id
-        if source_key not in self.axioms_by_source:
-            self.axioms_by_source[source_key] = []
-        self.axioms_by_source[source_key].append(axiom.axiom_id)
-        
-        # Update persona tracking
-        persona_key = axiom.source.persona_name or "default"
-        if persona_key not in self.axioms_by_persona:
-            self.axioms_by_persona[persona_key] = []
-        self.axioms_by_persona[persona_key].append(axiom.axiom_id)
     
     def add_edge(self, from_id: str, to_id: str, edge_type: str, strength: float = 1.0):
         """Add an edge between axioms."""
@@ -361,21 +410,30 @@ class AxiomNetwork:
     
     def build_edges_from_nodes(self):
         """Build edges from node relationship fields."""
-        for axiom in self.nodes.values():
-            for dep_id in axiom.depends_on:
-                self.add_edge(axiom.axiom_id, dep_id, "depends_on")
-            for enable_id in axiom.enables:
-                self.add_edge(axiom.axiom_id, enable_id, "enables")
-            for conflict_id in axiom.conflicts_with:
-                self.add_edge(axiom.axiom_id, conflict_id, "conflicts")
-            for support_id in axiom.supports:
-                self.add_edge(axiom.axiom_id, support_id, "supports")
+        self.edges.extend(
+            AxiomEdge(axiom.axiom_id, target_id, edge_type)
+            for axiom in self.nodes.values()
+            for edge_type, target_ids in (
+                ("depends_on", axiom.depends_on),
+                ("enables", axiom.enables),
+                ("conflicts", axiom.conflicts_with),
+                ("supports", axiom.supports),
+            )
+            for target_id in target_ids
+        )
+    
+    def _node_dicts(self, session_dict: Optional[dict]):
+        """Yield (axiom_id, node dict) pairs, sharing the network's session dict."""
+        session = self.session
+        for axiom_id, node in self.nodes.items():
+            yield axiom_id, node.to_dict(session_dict if node.session is session else None)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        session_dict = self.session.to_dict() if self.session else None
         return {
-            "session": self.session.to_dict() if self.session else None,
-            "nodes": {k: v.to_dict() for k, v in self.nodes.items()},
+            "session": session_dict,
+            "nodes": dict(self._node_dicts(session_dict)),
             "edges": [e.to_dict() for e in self.edges],
             "theories": [t.to_dict() for t in self.theories],
             "shared_axioms": self.shared_axioms,
@@ -386,9 +444,10 @@ class AxiomNetwork:
     
     def to_mindmap_json(self) -> dict:
         """Export format optimized for mind map visualization."""
+        session_dict = self.session.to_dict() if self.session else None
         return {
-            "session": self.session.to_dict() if self.session else None,
-            "nodes": [n.to_dict() for n in self.nodes.values()],
+            "session": session_dict,
+            "nodes": [node for _, node in self._node_dicts(session_dict)],
             "edges": [e.to_dict() for e in self.edges],
             "theories": [t.to_dict() for t in self.theories],
             "analysis": {
@@ -402,41 +461,62 @@ class AxiomNetwork:
     @classmethod
     def from_dict(cls, data: dict) -> "AxiomNetwork":
         """Create from dictionary."""
-        network = cls(
-            session=SessionContext.from_dict(data["session"]) if data.get("session") else None
-        )
-        
-        # Load nodes
-        for axiom_data in data.get("nodes", {}).values() if isinstance(data.get("nodes"), dict) else data.get("nodes", []):
-            if isinstance(axiom_data, dict):
-                network.nodes[axiom_data["axiom_id"]] = AxiomNode.from_dict(axiom_data)
+        session = SessionContext.from_dict(data["session"]) if data.get("session") else None
+        # Nodes normally repeat the network's session; share one object for them
+        shared_session = (data["session"], session) if session else None
         
-        # Load edges
-        for edge_data in data.get("edges", []):
-            network.edges.append(AxiomEdge.from_dict(edge_data))
+        nodes = data.get("nodes", [])
+        if isinstance(nodes, dict):
+            nodes = nodes.values()
         
-        # Load theories
-        for theory_data in data.get("theories", []):
-            network.theories.append(Theory.from_dict(theory_data))
-        
-        # Load analysis data
-        network.shared_axioms = data.get("shared_axioms", [])
-        network.conflict_clusters = data.get("conflict_clusters", [])
-        network.axioms_by_source = data.get("axioms_by_source", data.get("analysis", {}).get("by_source", {}))
-        network.axioms_by_persona = data.get("axioms_by_persona", data.get("analysis", {}).get("by_persona", {}))
+        # Build each collection in one comprehension rather than appending per item
+        network = cls(
+            session=session,
+            nodes={
+                axiom_data["axiom_id"]: AxiomNode.from_dict(axiom_data, shared_session)
+                for axiom_data in nodes
+                if isinstance(axiom_data, dict)
+            },
+            edges=[AxiomEdge.from_dict(edge_data) for edge_data in data.get("edges", [])],
+            theories=[Theory.from_dict(theory_data) for theory_data in data.get("theories", [])],
+            shared_axioms=data.get("shared_axioms", []),
+            conflict_clusters=data.get("conflict_clusters", [])
+        )
         
         return network
     
+    def _mindmap_document(self) -> dict:
+        """
+        Same layout as to_mindmap_json, but with the model objects left in place.
+        
+        The encoder serializes dataclasses field by field, so nodes, theories
+        and the session go straight to JSON without intermediate dicts. Edges
+        still go through to_dict because their JSON keys differ from the
+        field names.
+        """
+        return {
+            "session": self.session,
+            "nodes": list(self.nodes.values()),
+            "edges": [e.to_dict() for e in self.edges],
+            "theories": self.theories,
+            "analysis": {
+                "shared_axioms": self.shared_axioms,
+                "conflict_clusters": self.conflict_clusters,
+                "by_source": self.axioms_by_source,
+                "by_persona": self.axioms_by_persona
+            }
+        }
+    
     def save(self, filepath: str):
         """Save network to JSON file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_mindmap_json(), f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(dumps(self._mindmap_document(), indent=True))
     
     @classmethod
     def load(cls, filepath: str) -> "AxiomNetwork":
         """Load network from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = loads(f.read())
         return cls.from_dict(data)
 
 
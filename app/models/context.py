@@ -17,7 +17,7 @@ class ContextPhase(Enum):
     FINAL = "final"                 # Synthesizer compiles everything
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A single message in the context."""
     role: str  # "system", "user", "assistant"
@@ -28,32 +28,61 @@ class Message:
         return {"role": self.role, "content": self.content}
 
 
-@dataclass
+@dataclass(slots=True)
+class TokenCounts:
+    """Running token totals for one agent."""
+    input: int = 0
+    output: int = 0
+    total: int = 0
+    
+    def add(self, prompt_tokens: int, output_tokens: int) -> None:
+        """Accumulate usage from one generation."""
+        self.input += prompt_tokens
+        self.output += output_tokens
+        self.total += prompt_tokens + output_tokens
+
+
+@dataclass(slots=True)
 class ContextWindow:
     """Manages a context window with token tracking."""
     max_tokens: int
     messages: List[Message] = field(default_factory=list)
     system_prompt: Optional[str] = None
     total_tokens_used: int = 0
+    # get_summary results by max_chars, dropped whenever the messages change
+    _summary_cache: Dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    # API-format dicts for messages, kept in step with add_message
+    _message_dicts: List[Dict[str, str]] = field(default_factory=list, init=False, repr=False)
     
     def add_message(self, role: str, content: str, metadata: Optional[Dict] = None) -> None:
         """Add a message to the context."""
-        self.messages.append(Message(
+        message = Message(
             role=role,
             content=content,
             metadata=metadata or {}
-        ))
+        )
+        self.messages.append(message)
+        self._message_dicts.append(message.to_dict())
+        self._summary_cache.clear()
+    
+    def extend_messages(self, messages: List[Message]) -> None:
+        """Add several prepared messages at once."""
+        self.messages.extend(messages)
+        self._message_dicts.extend(m.to_dict() for m in messages)
+        self._summary_cache.clear()
     
     def get_messages(self, include_system: bool = True) -> List[Dict[str, str]]:
         """Get messages for API call."""
-        result = []
         if include_system and self.system_prompt:
-            result.append({"role": "system", "content": self.system_prompt})
-        result.extend([m.to_dict() for m in self.messages])
-        return result
+            return [{"role": "system", "content": self.system_prompt}, *self._message_dicts]
+        return self._message_dicts.copy()
     
     def get_summary(self, max_chars: int = 2000) -> str:
         """Get a summary of the context for handoff."""
+        cached = self._summary_cache.get(max_chars)
+        if cached is not None:
+            return cached
+        
         parts = []
         for msg in self.messages:
             if msg.role == "assistant":
@@ -63,12 +92,16 @@ class ContextWindow:
                 parts.append(f"[Question]: {msg.content[:200]}...")
         
         summary = "\n".join(parts)
-        return summary[:max_chars] if len(summary) > max_chars else summary
+        summary = summary[:max_chars] if len(summary) > max_chars else summary
+        self._summary_cache[max_chars] = summary
+        return summary
     
     def clear(self) -> None:
         """Clear all messages."""
         self.messages = []
         self.total_tokens_used = 0
+        self._summary_cache.clear()
+        self._message_dicts = []
     
     def update_tokens(self, prompt_tokens: int, output_tokens: int) -> None:
         """Update token tracking."""
@@ -107,8 +140,8 @@ class ContextManager:
         self.current_phase: ContextPhase = ContextPhase.DRAFT
         
         # Token usage tracking
-        self.worker_tokens: Dict[str, Dict[str, int]] = {}
-        self.synth_tokens: Dict[str, int] = {"input": 0, "output": 0, "total": 0}
+        self.worker_tokens: Dict[str, TokenCounts] = {}
+        self.synth_tokens: TokenCounts = TokenCounts()
     
     def initialize_worker(self, worker_id: str, system_prompt: str) -> None:
         """Initialize context for a worker."""
@@ -116,7 +149,7 @@ class ContextManager:
             max_tokens=self.worker_context_limit,
             system_prompt=system_prompt
         )
-        self.worker_tokens[worker_id] = {"input": 0, "output": 0, "total": 0}
+        self.worker_tokens[worker_id] = TokenCounts()
     
     def set_synth_system(self, system_prompt: str) -> None:
         """Set synthesizer system prompt."""
@@ -191,14 +224,19 @@ class ContextManager:
         
         if phase == ContextPhase.ARGUMENTATION:
             # Build shared context from all worker refinements
-            for worker_id, ctx in self.worker_contexts.items():
-                summary = ctx.get_summary(max_chars=1000)
-                if summary:
-                    self.shared_context.add_message(
-                        "user",
-                        f"[{worker_id.upper()} REFINED PROPOSAL]\n{summary}",
-                        {"source": worker_id, "type": "refinement_summary"}
-                    )
+            summaries = [
+                (worker_id, ctx.get_summary(max_chars=1000))
+                for worker_id, ctx in self.worker_contexts.items()
+            ]
+            self.shared_context.extend_messages([
+                Message(
+                    role="user",
+                    content=f"[{worker_id.upper()} REFINED PROPOSAL]\n{summary}",
+                    metadata={"source": worker_id, "type": "refinement_summary"}
+                )
+                for worker_id, summary in summaries
+                if summary
+            ])
     
     def update_worker_tokens(
         self,
@@ -207,28 +245,26 @@ class ContextManager:
         output_tokens: int
     ) -> None:
         """Update token tracking for a worker."""
-        if worker_id in self.worker_tokens:
-            self.worker_tokens[worker_id]["input"] += prompt_tokens
-            self.worker_tokens[worker_id]["output"] += output_tokens
-            self.worker_tokens[worker_id]["total"] += prompt_tokens + output_tokens
+        counts = self.worker_tokens.get(worker_id)
+        if counts is not None:
+            counts.add(prompt_tokens, output_tokens)
         
         if worker_id in self.worker_contexts:
             self.worker_contexts[worker_id].update_tokens(prompt_tokens, output_tokens)
     
     def update_synth_tokens(self, prompt_tokens: int, output_tokens: int) -> None:
         """Update token tracking for synthesizer."""
-        self.synth_tokens["input"] += prompt_tokens
-        self.synth_tokens["output"] += output_tokens
-        self.synth_tokens["total"] += prompt_tokens + output_tokens
+        self.synth_tokens.add(prompt_tokens, output_tokens)
         self.synth_context.update_tokens(prompt_tokens, output_tokens)
     
     def get_worker_token_stats(self, worker_id: str) -> Dict[str, int]:
         """Get token stats for a worker."""
         ctx = self.get_worker_context(worker_id)
+        counts = self.worker_tokens.get(worker_id) or TokenCounts()
         return {
-            "input_tokens": self.worker_tokens.get(worker_id, {}).get("input", 0),
-            "output_tokens": self.worker_tokens.get(worker_id, {}).get("output", 0),
-            "total_tokens": self.worker_tokens.get(worker_id, {}).get("total", 0),
+            "input_tokens": counts.input,
+            "output_tokens": counts.output,
+            "total_tokens": counts.total,
             "context_used": ctx.total_tokens_used,
             "context_limit": self.worker_context_limit
         }
@@ -236,9 +272,9 @@ class ContextManager:
     def get_synth_token_stats(self) -> Dict[str, int]:
         """Get token stats for synthesizer."""
         return {
-            "input_tokens": self.synth_tokens["input"],
-            "output_tokens": self.synth_tokens["output"],
-            "total_tokens": self.synth_tokens["total"],
+            "input_tokens": self.synth_tokens.input,
+            "output_tokens": self.synth_tokens.output,
+            "total_tokens": self.synth_tokens.total,
             "context_used": self.synth_context.total_tokens_used,
             "context_limit": self.synth_context_limit
         }
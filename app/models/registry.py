@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from ..config import AppConfig, RAMMode
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelSpec:
     """Specification for a model."""
     name: str
@@ -64,6 +64,19 @@ class ModelRegistry:
         """Set the list of available models (from Ollama)."""
         self._available_models = models
     
+    def _find_available(self, model_name: str) -> Optional[str]:
+        """
+        Find the first available model matching a name.
+        
+        A model matches if it contains the name (e.g. "qwen2.5:3b" matches
+        "qwen2.5:3b-instruct") or shares its family prefix before the tag.
+        """
+        family = model_name.split(':', 1)[0]
+        for available in self._available_models or ():
+            if model_name in available or available.startswith(family):
+                return available
+        return None
+    
     def get_worker_model(self) -> ModelSpec:
         """Get the model specification for workers."""
         mode_config = self.config.mode_config
@@ -113,9 +126,9 @@ class ModelRegistry:
         candidates = self.MODELS_BY_SIZE.get(target_size, [])
         for model in candidates:
             # Check for exact or partial match
-            for available in self._available_models:
-                if model in available or available.startswith(model.split(':')[0]):
-                    return available
+            match = self._find_available(model)
+            if match:
+                return match
         
         return None
     
@@ -142,18 +155,9 @@ class ModelRegistry:
         if not self._available_models:
             return {"workers": False, "synthesizer": False}
         
-        worker_model = self.get_worker_model().name
-        synth_model = self.get_synthesizer_model().name
-        
-        def is_available(model_name: str) -> bool:
-            return any(
-                model_name in m or m.startswith(model_name.split(':')[0])
-                for m in self._available_models
-            )
-        
         return {
-            "workers": is_available(worker_model),
-            "synthesizer": is_available(synth_model)
+            "workers": self._find_available(self.get_worker_model().name) is not None,
+            "synthesizer": self._find_available(self.get_synthesizer_model().name) is not None
         }
     
     def get_context_limit(self, role: str) -> int:
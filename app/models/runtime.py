@@ -3,16 +3,25 @@ AI Council - Ollama Runtime Interface
 Handles model loading, unloading, and inference via Ollama.
 """
 
-import json
+import random
 import time
 import requests
-from typing import Dict, Any, Optional, Generator, List
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Generator, List, Tuple
 from dataclasses import dataclass
 
 from ..config import OllamaConfig
+from ..utils.serialization import dumps, loads
 
 
-@dataclass
+# Request bodies are pre-encoded with dumps(), so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Repeated availability checks within this window reuse one /api/tags call
+_MODELS_CACHE_SECONDS = 5.0
+
+
+@dataclass(slots=True)
 class GenerationResult:
     """Result from a generation request."""
     text: str
@@ -46,23 +55,45 @@ class OllamaRuntime:
         self.timeout = config.timeout
         self.retry_attempts = config.retry_attempts
         self.retry_delay = config.retry_delay
+        self.keep_alive = config.keep_alive
         self._current_model: Optional[str] = None
+        self._models_cache: Optional[Tuple[float, List[str]]] = None  # (fetched_at, names)
+        
+        # Keep-alive connection pool shared by all calls to Ollama
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def close(self):
+        """Close pooled connections to Ollama."""
+        self._session.close()
+    
+    def invalidate_models_cache(self):
+        """Forget the cached model list so the next lookup queries Ollama."""
+        self._models_cache = None
     
     def check_health(self) -> bool:
         """Check if Ollama is running and accessible."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
     
     def list_models(self) -> List[str]:
-        """List available models."""
+        """List available models (cached briefly; failed lookups are not cached)."""
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_SECONDS:
+            return list(cached[1])
+        
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=10)
             if response.status_code == 200:
-                data = response.json()
-                return [m["name"] for m in data.get("models", [])]
+                data = loads(response.content)
+                models = [m["name"] for m in data.get("models", [])]
+                self._models_cache = (time.monotonic(), models)
+                return list(models)
         except Exception:
             pass
         return []
@@ -70,8 +101,9 @@ class OllamaRuntime:
     def is_model_available(self, model_name: str) -> bool:
         """Check if a specific model is available."""
         models = self.list_models()
+        family = model_name.split(':', 1)[0]
         # Handle both exact match and partial match (e.g., "qwen2.5:3b" matches "qwen2.5:3b-instruct")
-        return any(model_name in m or m.startswith(model_name.split(':')[0]) for m in models)
+        return any(model_name in m or m.startswith(family) for m in models)
     
     def load_model(self, model_name: str) -> bool:
         """
@@ -85,17 +117,20 @@ class OllamaRuntime:
         """
         try:
             # Ollama loads models on first use, but we can warm it up
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
-                json={
+                data=dumps({
                     "model": model_name,
                     "prompt": "Hello",
+                    "keep_alive": self.keep_alive,
                     "options": {"num_predict": 1}
-                },
+                }),
+                headers=_JSON_HEADERS,
                 timeout=self.timeout
             )
             if response.status_code == 200:
                 self._current_model = model_name
+                self.invalidate_models_cache()
                 return True
         except Exception:
             pass
@@ -117,18 +152,20 @@ class OllamaRuntime:
         
         try:
             # Ollama doesn't have explicit unload, but we can set keep_alive to 0
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
-                json={
+                data=dumps({
                     "model": target,
                     "prompt": "",
                     "keep_alive": 0
-                },
+                }),
+                headers=_JSON_HEADERS,
                 timeout=10
             )
             if response.status_code == 200:
                 if target == self._current_model:
                     self._current_model = None
+                self.invalidate_models_cache()
                 return True
         except Exception:
             pass
@@ -195,6 +232,7 @@ class OllamaRuntime:
             "model": model,
             "messages": messages,
             "stream": False,
+            "keep_alive": self.keep_alive,
             "options": {
                 "num_predict": max_tokens,
                 "temperature": temperature
@@ -205,18 +243,20 @@ class OllamaRuntime:
             payload["format"] = "json"
         
         last_error = None
-        for attempt in range(self.retry_attempts):
+        attempt = 0
+        for attempt in range(1, self.retry_attempts + 1):
             try:
                 start_time = time.time()
-                response = requests.post(
+                response = self._session.post(
                     f"{self.base_url}/api/chat",
-                    json=payload,
+                    data=dumps(payload),
+                    headers=_JSON_HEADERS,
                     timeout=self.timeout
                 )
                 duration_ms = (time.time() - start_time) * 1000
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = loads(response.content)
                     self._current_model = model
                     
                     # Extract token counts from Ollama response
@@ -235,7 +275,10 @@ class OllamaRuntime:
                     )
                 else:
                     last_error = f"HTTP {response.status_code}: {response.text}"
-                    
+                    # Client errors (unknown model, bad request) won't succeed on retry
+                    if 400 <= response.status_code < 500 and response.status_code != 429:
+                        break
+            
             except requests.exceptions.Timeout:
                 last_error = "Request timeout"
             except requests.exceptions.ConnectionError:
@@ -243,10 +286,12 @@ class OllamaRuntime:
             except Exception as e:
                 last_error = str(e)
             
-            if attempt < self.retry_attempts - 1:
-                time.sleep(self.retry_delay)
+            if attempt < self.retry_attempts:
+                # Exponential backoff with jitter so workers don't retry in lockstep
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                time.sleep(delay + random.uniform(0, delay / 2))
         
-        raise RuntimeError(f"Generation failed after {self.retry_attempts} attempts: {last_error}")
+        raise RuntimeError(f"Generation failed after {attempt} attempts: {last_error}")
     
     def chat_stream(
         self,
@@ -271,6 +316,7 @@ class OllamaRuntime:
             "model": model,
             "messages": messages,
             "stream": True,
+            "keep_alive": self.keep_alive,
             "options": {
                 "num_predict": max_tokens,
                 "temperature": temperature
@@ -278,39 +324,41 @@ class OllamaRuntime:
         }
         
         try:
-            response = requests.post(
+            # Closing the response returns its connection to the pool
+            with self._session.post(
                 f"{self.base_url}/api/chat",
-                json=payload,
+                data=dumps(payload),
+                headers=_JSON_HEADERS,
                 stream=True,
                 timeout=self.timeout
-            )
-            
-            if response.status_code == 200:
-                self._current_model = model
-                for line in response.iter_lines():
-                    if line:
-                        data = json.loads(line)
-                        content = data.get("message", {}).get("content", "")
-                        if content:
-                            yield content
-                        if data.get("done", False):
-                            break
-            else:
-                raise RuntimeError(f"Streaming failed: HTTP {response.status_code}")
-                
+            ) as response:
+                if response.status_code == 200:
+                    self._current_model = model
+                    for line in response.iter_lines():
+                        if line:
+                            data = loads(line)
+                            content = data.get("message", {}).get("content", "")
+                            if content:
+                                yield content
+                            if data.get("done", False):
+                                break
+                else:
+                    raise RuntimeError(f"Streaming failed: HTTP {response.status_code}")
+        
         except Exception as e:
             raise RuntimeError(f"Streaming error: {e}")
     
     def get_model_info(self, model_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a model."""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/show",
-                json={"name": model_name},
+                data=dumps({"name": model_name}),
+                headers=_JSON_HEADERS,
                 timeout=10
             )
             if response.status_code == 200:
-                return response.json()
+                return loads(response.content)
         except Exception:
             pass
         return None
@@ -4,12 +4,18 @@ Coordinates the full multi-agent pipeline execution.
 """
 
 import uuid
-import difflib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Generator
+from typing import Dict, List, Optional, Any, Callable, Generator, Iterator, Tuple
 from enum import Enum
 
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # Optional speedup - fall back to difflib
+    Indel = None
+
 from .config import AppConfig
 from .models.runtime import OllamaRuntime
 from .models.registry import ModelRegistry
@@ -19,6 +25,16 @@ from .personas.manager import PersonaManager
 from .voting.voter import Voter, VoteAction
 from .utils.memory import MemoryMonitor
 from .utils.logging import SessionLogger
+from .utils.serialization import dumps
+
+
+# Weight of the latest round in each worker's refinement similarity average
+_SIMILARITY_EWMA_WEIGHT = 0.5
+
+# Asked of a worker the synthesizer had no specific questions for
+_DEFAULT_REFINEMENT_QUESTIONS = (
+    "Based on the synthesizer's overall observations, how can you improve or clarify your proposal?",
+)
 
 
 class PipelineStage(Enum):
@@ -127,6 +143,7 @@ class Orchestrator:
         self._round_feedback: Dict[int, Dict[str, Any]] = {}  # round_num -> feedback
         self._awaiting_round_feedback: bool = False
         self._skip_to_synthesis: bool = False
+        self._similarity_ewma: Dict[str, float] = {}  # worker_id -> smoothed refinement similarity
         
         # Argumentation round tracking
         self._current_arg_round: int = 0
@@ -255,31 +272,43 @@ class Orchestrator:
         for worker_id, worker in self.workers.items():
             yield {"type": "worker_start", "worker_id": worker_id, "persona": worker.persona.name if worker.persona else "Default"}
             
-            # Check memory before each worker
+        # Check memory before the workers start
+        if self.memory_monitor.should_unload_model():
+            yield {"type": "memory_warning", "message": "High memory usage detected"}
+            
+        # Drafts are independent, so request them together and report each as it finishes
+        for worker_id, draft in self._run_concurrently({
+            worker_id: partial(worker.generate_draft, self.prompt, self.constraints)
+            for worker_id, worker in self.workers.items()
+        }):
+            worker = self.workers[worker_id]
+            draft_dict = draft.to_dict()
+            drafts[worker_id] = draft_dict
+            
+            # Check memory again as each draft lands, since parallel calls peak here
             if self.memory_monitor.should_unload_model():
                 yield {"type": "memory_warning", "message": "High memory usage detected"}
             
-            draft = worker.generate_draft(self.prompt, self.constraints)
-            drafts[worker_id] = draft.to_dict()
-            
             # Log
             self.logger.log(
                 stage="worker_draft",
                 agent_id=worker_id,
                 input_text=self.prompt,
                 output_text=draft.summary,
-                persona_id=worker.persona.id if worker.persona else None,
-                persona_name=worker.persona.name if worker.persona else None,
+                persona_id=worker.persona_id,
+                persona_name=worker.persona_name,
                 memory_usage_mb=self.memory_monitor.get_memory_mb()
             )
             
             yield {
                 "type": "worker_complete",
                 "worker_id": worker_id,
-                "draft": draft.to_dict(),
+                "draft": draft_dict,
                 "tokens": worker.get_last_token_usage()
             }
         
+        # Keep worker order for the synthesizer prompt
+        drafts = {worker_id: drafts[worker_id] for worker_id in self.workers}
         self._stage_outputs["drafts"] = drafts
         yield {"type": "stage_complete", "stage": "worker_drafts"}
         
@@ -291,7 +320,8 @@ class Orchestrator:
         self.current_stage = PipelineStage.SYNTH_QUESTIONS
         yield {"type": "stage_start", "stage": "synth_questions"}
         
-        synth_input_text = str(drafts)
+        # Canonical JSON keeps the cache key independent of dict repr details
+        synth_input_text = dumps(drafts, sort_keys=True).decode("utf-8")
         synth_input_hash = self.logger.compute_hash(synth_input_text)
         cached_questions_entry = self.logger.find_entry(
             stage="synth_questions",
@@ -318,7 +348,8 @@ class Orchestrator:
                 agent_id="synthesizer",
                 input_text=synth_input_text,
                 output_text=questions.raw_text,
-                memory_usage_mb=self.memory_monitor.get_memory_mb()
+                memory_usage_mb=self.memory_monitor.get_memory_mb(),
+                input_hash=synth_input_hash
             )
         
         self._stage_outputs["questions"] = questions.to_dict()
@@ -336,88 +367,16 @@ class Orchestrator:
             self.current_stage = PipelineStage.WORKER_REFINEMENT
             yield {"type": "stage_start", "stage": f"worker_refinement_{loop + 1}"}
             
-            refinements = {}
-            similarity_hits = []
-            for worker_id, worker in self.workers.items():
-                worker_questions = questions.questions_by_worker.get(worker_id, [])
-                
-                # If no questions for this worker, give them a default refinement prompt
-                if not worker_questions:
-                    worker_questions = ["Based on the synthesizer's overall observations, how can you improve or clarify your proposal?"]
-                
-                yield {"type": "worker_start", "worker_id": worker_id, "stage": "refinement"}
-                
-                # Get user guidance from previous round feedback (if any)
-                user_guidance = None
-                prev_round_feedback = self._round_feedback.get(loop, {})
-                if prev_round_feedback:
-                    user_guidance = prev_round_feedback.get("worker_feedback", {}).get(worker_id)
-                
-                current_draft_summary = worker.current_draft.summary if worker.current_draft else "No draft"
-                full_input_text = f"CURRENT PROPOSAL:\n{current_draft_summary}\n\nSYNTHESIZER QUESTIONS:\n" + "\n".join(f"- {q}" for q in worker_questions)
-                if user_guidance:
-                    full_input_text += f"\n\nUSER FEEDBACK:\n{user_guidance}"
-
-                input_hash = self.logger.compute_hash(full_input_text)
-                cached_refinement_entry = self.logger.find_entry(
-                    stage="refinement",
-                    agent_id=worker_id,
-                    input_hash=input_hash
-                )
-                if cached_refinement_entry:
-                    refinement = WorkerRefinement.from_json(cached_refinement_entry.output_text)
-                    if not worker.refinements or worker.refinements[-1].raw_text != refinement.raw_text:
-                        worker.refinements.append(refinement)
-                    self.logger.log(
-                        stage="refinement",
-                        agent_id=worker_id,
-                        input_text=full_input_text,
-                        output_text=refinement.raw_text,
-                        persona_id=worker.persona.id if worker.persona else None,
-                        persona_name=worker.persona.name if worker.persona else None,
-                        memory_usage_mb=self.memory_monitor.get_memory_mb(),
-                        metadata={
-                            "round": loop + 1,
-                            "stage_label": f"worker_refinement_{loop + 1}",
-                            "cache_hit": True
-                        }
-                    )
-                else:
-                    refinement = worker.refine(worker_questions, user_guidance=user_guidance)
-                    self.logger.log(
-                        stage="refinement",
-                        agent_id=worker_id,
-                        input_text=full_input_text,
-                        output_text=refinement.raw_text,
-                        persona_id=worker.persona.id if worker.persona else None,
-                        persona_name=worker.persona.name if worker.persona else None,
-                        memory_usage_mb=self.memory_monitor.get_memory_mb(),
-                        metadata={
-                            "round": loop + 1,
-                            "stage_label": f"worker_refinement_{loop + 1}",
-                            "cache_hit": False
-                        }
-                    )
-
-                refinements[worker_id] = refinement.to_dict()
-                
-                yield {
-                    "type": "worker_complete",
-                    "worker_id": worker_id,
-                    "refinement": refinement.to_dict(),
-                    "tokens": worker.get_last_token_usage()
-                }
-
-                if len(worker.refinements) > 1:
-                    previous = worker.refinements[-2].raw_text
-                    current = worker.refinements[-1].raw_text
-                    similarity = difflib.SequenceMatcher(a=previous, b=current).ratio()
-                    similarity_hits.append(similarity >= self.refinement_similarity_threshold)
+            refinements, converged = yield from self._refine_workers(loop, questions)
             
             self._stage_outputs[f"refinements_{loop + 1}"] = refinements
-            yield {"type": "stage_complete", "stage": f"worker_refinement_{loop + 1}"}
+            yield {
+                "type": "stage_complete",
+                "stage": f"worker_refinement_{loop + 1}",
+                "similarity": {wid: round(value, 3) for wid, value in self._similarity_ewma.items()}
+            }
 
-            if similarity_hits and all(similarity_hits):
+            if converged:
                 yield {
                     "type": "info",
                     "message": "Refinement halted due to high similarity with previous outputs."
@@ -536,8 +495,8 @@ class Orchestrator:
                     agent_id="user",
                     input_text=f"worker_feedback:{worker_id}",
                     output_text=feedback,
-                    persona_id=worker.persona.id if worker and worker.persona else None,
-                    persona_name=worker.persona.name if worker and worker.persona else None,
+                    persona_id=worker.persona_id if worker else None,
+                    persona_name=worker.persona_name if worker else None,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
         
@@ -746,14 +705,15 @@ class Orchestrator:
             if worker_id not in self._archived_outputs:
                 self._archived_outputs[worker_id] = []
             self._archived_outputs[worker_id].append({
-                "persona_id": worker.persona.id if worker.persona else None,
-                "persona_name": worker.persona.name if worker.persona else None,
+                "persona_id": worker.persona_id,
+                "persona_name": worker.persona_name,
                 "draft": worker.current_draft.to_dict() if worker.current_draft else None,
                 "archived_at": datetime.utcnow().isoformat()
             })
         
         if action == "restart":
             worker.clear_state()
+            self._similarity_ewma.pop(worker_id, None)
         
         # Set new persona
         worker.set_persona(new_persona)
@@ -806,8 +766,8 @@ class Orchestrator:
                     agent_id="user",
                     input_text=f"worker_feedback:{worker_id}",
                     output_text=feedback,
-                    persona_id=worker.persona.id if worker and worker.persona else None,
-                    persona_name=worker.persona.name if worker and worker.persona else None,
+                    persona_id=worker.persona_id if worker else None,
+                    persona_name=worker.persona_name if worker else None,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
         
@@ -860,8 +820,8 @@ class Orchestrator:
                     agent_id="user",
                     input_text=f"worker_feedback:{worker_id}",
                     output_text=feedback,
-                    persona_id=worker.persona.id if worker and worker.persona else None,
-                    persona_name=worker.persona.name if worker and worker.persona else None,
+                    persona_id=worker.persona_id if worker else None,
+                    persona_name=worker.persona_name if worker else None,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
         
@@ -914,8 +874,8 @@ class Orchestrator:
                     agent_id="user",
                     input_text=f"worker_feedback:{worker_id}",
                     output_text=feedback,
-                    persona_id=worker.persona.id if worker and worker.persona else None,
-                    persona_name=worker.persona.name if worker and worker.persona else None,
+                    persona_id=worker.persona_id if worker else None,
+                    persona_name=worker.persona_name if worker else None,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
         
@@ -985,88 +945,16 @@ class Orchestrator:
                 self.current_stage = PipelineStage.WORKER_REFINEMENT
                 yield {"type": "stage_start", "stage": f"worker_refinement_{loop + 1}"}
                 
-                refinements = {}
-                similarity_hits = []
-                for worker_id, worker in self.workers.items():
-                    worker_questions = questions.questions_by_worker.get(worker_id, []) if questions else []
-                    
-                    # If no questions for this worker, give them a default refinement prompt
-                    if not worker_questions:
-                        worker_questions = ["Based on the synthesizer's overall observations, how can you improve or clarify your proposal?"]
-                    
-                    yield {"type": "worker_start", "worker_id": worker_id, "stage": "refinement"}
-                    
-                    # Get user guidance from previous round feedback
-                    user_guidance = None
-                    prev_round_feedback = self._round_feedback.get(loop, {})  # Round `loop` feedback for round `loop+1`
-                    if prev_round_feedback:
-                        user_guidance = prev_round_feedback.get("worker_feedback", {}).get(worker_id)
-                    
-                    current_draft_summary = worker.current_draft.summary if worker.current_draft else "No draft"
-                    full_input_text = f"CURRENT PROPOSAL:\n{current_draft_summary}\n\nSYNTHESIZER QUESTIONS:\n" + "\n".join(f"- {q}" for q in worker_questions)
-                    if user_guidance:
-                        full_input_text += f"\n\nUSER FEEDBACK:\n{user_guidance}"
-
-                    input_hash = self.logger.compute_hash(full_input_text)
-                    cached_refinement_entry = self.logger.find_entry(
-                        stage="refinement",
-                        agent_id=worker_id,
-                        input_hash=input_hash
-                    )
-                    if cached_refinement_entry:
-                        refinement = WorkerRefinement.from_json(cached_refinement_entry.output_text)
-                        if not worker.refinements or worker.refinements[-1].raw_text != refinement.raw_text:
-                            worker.refinements.append(refinement)
-                        self.logger.log(
-                            stage="refinement",
-                            agent_id=worker_id,
-                            input_text=full_input_text,
-                            output_text=refinement.raw_text,
-                            persona_id=worker.persona.id if worker.persona else None,
-                            persona_name=worker.persona.name if worker.persona else None,
-                            memory_usage_mb=self.memory_monitor.get_memory_mb(),
-                            metadata={
-                                "round": loop + 1,
-                                "stage_label": f"worker_refinement_{loop + 1}",
-                                "cache_hit": True
-                            }
-                        )
-                    else:
-                        refinement = worker.refine(worker_questions, user_guidance=user_guidance)
-                        self.logger.log(
-                            stage="refinement",
-                            agent_id=worker_id,
-                            input_text=full_input_text,
-                            output_text=refinement.raw_text,
-                            persona_id=worker.persona.id if worker.persona else None,
-                            persona_name=worker.persona.name if worker.persona else None,
-                            memory_usage_mb=self.memory_monitor.get_memory_mb(),
-                            metadata={
-                                "round": loop + 1,
-                                "stage_label": f"worker_refinement_{loop + 1}",
-                                "cache_hit": False
-                            }
-                        )
-
-                    refinements[worker_id] = refinement.to_dict()
-                    
-                    yield {
-                        "type": "worker_complete",
-                        "worker_id": worker_id,
-                        "refinement": refinement.to_dict(),
-                        "tokens": worker.get_last_token_usage()
-                    }
-
-                    if len(worker.refinements) > 1:
-                        previous = worker.refinements[-2].raw_text
-                        current = worker.refinements[-1].raw_text
-                        similarity = difflib.SequenceMatcher(a=previous, b=current).ratio()
-                        similarity_hits.append(similarity >= self.refinement_similarity_threshold)
+                refinements, converged = yield from self._refine_workers(loop, questions)
                 
                 self._stage_outputs[f"refinements_{loop + 1}"] = refinements
-                yield {"type": "stage_complete", "stage": f"worker_refinement_{loop + 1}"}
+                yield {
+                    "type": "stage_complete",
+                    "stage": f"worker_refinement_{loop + 1}",
+                    "similarity": {wid: round(value, 3) for wid, value in self._similarity_ewma.items()}
+                }
 
-                if similarity_hits and all(similarity_hits):
+                if converged:
                     yield {
                         "type": "info",
                         "message": "Refinement halted due to high similarity with previous outputs."
@@ -1106,6 +994,186 @@ class Orchestrator:
         for event in self._run_synthesis_and_voting():
             yield event
     
+    def _refine_workers(
+        self,
+        loop: int,
+        questions: Optional[Any]
+    ) -> Generator[Dict[str, Any], None, Tuple[Dict[str, Any], bool]]:
+        """
+        Run one refinement round across all workers.
+        
+        Cached refinements are replayed straight away; the remaining workers
+        refine concurrently and are reported in completion order, so a slow
+        worker no longer delays the others within the round.
+        
+        Refinement has converged once every worker's latest refinement is
+        near-identical to its previous one, or once every worker's moving
+        average of that similarity reaches the threshold, so a single noisy
+        round doesn't force another full round.
+        
+        Args:
+            loop: Zero-based refinement round.
+            questions: Synthesizer questions for this round, if any.
+        
+        Yields:
+            worker_start and worker_complete events.
+        
+        Returns:
+            (refinements by worker_id in worker order, whether refinement converged)
+        """
+        refinements = {}
+        similarity_hits = []
+        pending: Dict[str, Callable[[], Any]] = {}
+        pending_inputs: Dict[str, Tuple[str, str]] = {}
+        
+        def record(
+            worker_id: str,
+            refinement: Any,
+            full_input_text: str,
+            input_hash: str,
+            cache_hit: bool,
+            appended: bool = True
+        ):
+            worker = self.workers[worker_id]
+            self.logger.log(
+                stage="refinement",
+                agent_id=worker_id,
+                input_text=full_input_text,
+                output_text=refinement.raw_text,
+                persona_id=worker.persona_id,
+                persona_name=worker.persona_name,
+                memory_usage_mb=self.memory_monitor.get_memory_mb(),
+                metadata={
+                    "round": loop + 1,
+                    "stage_label": f"worker_refinement_{loop + 1}",
+                    "cache_hit": cache_hit
+                },
+                input_hash=input_hash
+            )
+            
+            refinement_dict = refinement.to_dict()
+            refinements[worker_id] = refinement_dict
+            
+            if len(worker.refinements) > 1:
+                previous = worker.refinements[-2].raw_text
+                current = worker.refinements[-1].raw_text
+                similarity = self._refinement_similarity(previous, current)
+                similarity_hits.append(similarity >= self.refinement_similarity_threshold)
+                # A replayed refinement that matched the last one adds no new pair to average
+                if appended:
+                    ewma = self._similarity_ewma.get(worker_id)
+                    self._similarity_ewma[worker_id] = similarity if ewma is None else (
+                        _SIMILARITY_EWMA_WEIGHT * similarity + (1 - _SIMILARITY_EWMA_WEIGHT) * ewma
+                    )
+            
+            return {
+                "type": "worker_complete",
+                "worker_id": worker_id,
+                "refinement": refinement_dict,
+                "tokens": worker.get_last_token_usage()
+            }
+        
+        # Workers without questions get a default refinement prompt
+        round_questions = {
+            worker_id: (questions.questions_by_worker.get(worker_id) if questions else None)
+            or _DEFAULT_REFINEMENT_QUESTIONS
+            for worker_id in self.workers
+        }
+        
+        for worker_id, worker in self.workers.items():
+            worker_questions = round_questions[worker_id]
+            
+            yield {"type": "worker_start", "worker_id": worker_id, "stage": "refinement"}
+            
+            # Get user guidance from previous round feedback (if any)
+            user_guidance = None
+            prev_round_feedback = self._round_feedback.get(loop, {})  # Round `loop` feedback for round `loop+1`
+            if prev_round_feedback:
+                user_guidance = prev_round_feedback.get("worker_feedback", {}).get(worker_id)
+            
+            current_draft_summary = worker.current_draft.summary if worker.current_draft else "No draft"
+            # worker_questions is never empty, so every question gets a "- " bullet
+            # Summaries and questions come from parsed model JSON and may not be strings
+            full_input_text = "".join((
+                "CURRENT PROPOSAL:\n", str(current_draft_summary),
+                "\n\nSYNTHESIZER QUESTIONS:\n- ", "\n- ".join(map(str, worker_questions))
+            ))
+            if user_guidance:
+                full_input_text += f"\n\nUSER FEEDBACK:\n{user_guidance}"
+            
+            input_hash = self.logger.compute_hash(full_input_text)
+            cached_refinement_entry = self.logger.find_entry(
+                stage="refinement",
+                agent_id=worker_id,
+                input_hash=input_hash
+            )
+            if cached_refinement_entry:
+                refinement = WorkerRefinement.from_json(cached_refinement_entry.output_text)
+                appended = not worker.refinements or worker.refinements[-1].raw_text != refinement.raw_text
+                if appended:
+                    worker.refinements.append(refinement)
+                yield record(worker_id, refinement, full_input_text, input_hash, cache_hit=True, appended=appended)
+            else:
+                pending[worker_id] = partial(worker.refine, worker_questions, user_guidance=user_guidance)
+                pending_inputs[worker_id] = (full_input_text, input_hash)
+        
+        for worker_id, refinement in self._run_concurrently(pending):
+            full_input_text, input_hash = pending_inputs[worker_id]
+            yield record(worker_id, refinement, full_input_text, input_hash, cache_hit=False)
+        
+        # Follow-up questions and stage outputs expect worker order
+        refinements = {worker_id: refinements[worker_id] for worker_id in self.workers if worker_id in refinements}
+        
+        threshold = self.refinement_similarity_threshold
+        converged = bool(similarity_hits) and (
+            all(similarity_hits)
+            or all(self._similarity_ewma.get(worker_id, 0.0) >= threshold for worker_id in self.workers)
+        )
+        return refinements, converged
+    
+    def _refinement_similarity(self, previous: str, current: str) -> float:
+        """
+        Measure how much a refinement changed from the previous one.
+        
+        The exact value is always computed: it feeds the worker's moving
+        average, which carries across rounds.
+        
+        Args:
+            previous: Raw text of the previous refinement.
+            current: Raw text of the latest refinement.
+        
+        Returns:
+            Similarity from 0.0 (unrelated) to 1.0 (identical).
+        """
+        if Indel is not None:
+            return Indel.normalized_similarity(previous, current)
+        from difflib import SequenceMatcher  # Only needed without rapidfuzz
+        return SequenceMatcher(a=previous, b=current).ratio()
+    
+    def _run_concurrently(self, calls: Dict[str, Callable[[], Any]]) -> Iterator[Tuple[str, Any]]:
+        """
+        Run independent worker calls in parallel threads.
+        
+        Model calls are I/O-bound, so Ollama can serve them concurrently (up
+        to its OLLAMA_NUM_PARALLEL slots) instead of one after another. Each
+        parallel call holds its own KV cache, so the mode's
+        memory.max_parallel_requests caps how many run at once, and
+        aggressive model unloading keeps them sequential.
+        
+        Args:
+            calls: Mapping of worker_id to a zero-argument callable.
+        
+        Yields:
+            (worker_id, result) pairs in completion order. An exception from
+            any call is re-raised here.
+        """
+        memory = self.config.mode_config.memory
+        max_parallel = 1 if memory.model_unloading == "aggressive" else max(memory.max_parallel_requests, 1)
+        with ThreadPoolExecutor(max_workers=max(min(len(calls), max_parallel), 1)) as executor:
+            futures = {executor.submit(call): worker_id for worker_id, call in calls.items()}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
     def _run_synthesis_and_voting(self) -> Generator[Dict[str, Any], None, None]:
         """
         Run synthesis, argumentation, collaboration, and voting stages.
@@ -1216,8 +1284,8 @@ class Orchestrator:
                     agent_id=worker_id,
                     input_text=str(alternatives),
                     output_text=argument.raw_text,
-                    persona_id=worker.persona.id if worker.persona else None,
-                    persona_name=worker.persona.name if worker.persona else None,
+                    persona_id=worker.persona_id,
+                    persona_name=worker.persona_name,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
                 
@@ -1375,8 +1443,8 @@ class Orchestrator:
                     agent_id=worker_id,
                     input_text=str(compatible_proposals),
                     output_text=str(collab_output),
-                    persona_id=worker.persona.id if worker.persona else None,
-                    persona_name=worker.persona.name if worker.persona else None,
+                    persona_id=worker.persona_id,
+                    persona_name=worker.persona_name,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
                 
@@ -1475,8 +1543,8 @@ class Orchestrator:
                     agent_id=worker_id,
                     input_text=str(compatible_proposals),
                     output_text=str(collab_output),
-                    persona_id=worker.persona.id if worker.persona else None,
-                    persona_name=worker.persona.name if worker.persona else None,
+                    persona_id=worker.persona_id,
+                    persona_name=worker.persona_name,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
                 
@@ -1570,8 +1638,8 @@ class Orchestrator:
                         agent_id=worker_id,
                         input_text=str(alternatives),
                         output_text=argument.raw_text,
-                        persona_id=worker.persona.id if worker.persona else None,
-                        persona_name=worker.persona.name if worker.persona else None,
+                        persona_id=worker.persona_id,
+                        persona_name=worker.persona_name,
                         memory_usage_mb=self.memory_monitor.get_memory_mb()
                     )
                     
@@ -1766,7 +1834,7 @@ class Orchestrator:
                 self._worker_axioms[worker_id] = extracted_axioms
                 
                 # Log warning if no axioms extracted
-                if not extracted_axioms or len(extracted_axioms) == 0:
+                if not extracted_axioms:
                     import logging
                     logging.warning(
                         f"No axioms extracted from {worker_id}. "
@@ -1779,8 +1847,8 @@ class Orchestrator:
                     agent_id=worker_id,
                     input_text=conversation_summary,  # Log full summary, not truncated
                     output_text=str(worker_axiom_result),
-                    persona_id=worker.persona.id if worker.persona else None,
-                    persona_name=worker.persona.name if worker.persona else None,
+                    persona_id=worker.persona_id,
+                    persona_name=worker.persona_name,
                     memory_usage_mb=self.memory_monitor.get_memory_mb()
                 )
                 
@@ -1871,8 +1939,8 @@ class Orchestrator:
                 axiom_counter[worker_id] += 1
                 source = AxiomSource.worker(
                     worker_id=worker_id,
-                    persona_id=worker.persona.id if worker and worker.persona else None,
-                    persona_name=worker.persona.name if worker and worker.persona else None
+                    persona_id=worker.persona_id if worker else None,
+                    persona_name=worker.persona_name if worker else None
                 )
                 axiom = AxiomNode(
                     axiom_id=generate_axiom_id(self.session_id, source, axiom_counter[worker_id]),
@@ -2197,7 +2265,7 @@ class Orchestrator:
             other_proposals = [
                 {
                     "worker_id": wid,
-                    "persona_name": w.persona.name if w.persona else None,
+                    "persona_name": w.persona_name,
                     "summary": w.current_draft.summary
                 }
                 for wid, w in self.workers.items()
@@ -2224,8 +2292,8 @@ class Orchestrator:
                 agent_id=worker_id,
                 input_text=str(other_proposals),
                 output_text=diversified_draft.summary,
-                persona_id=worker.persona.id if worker.persona else None,
-                persona_name=worker.persona.name if worker.persona else None,
+                persona_id=worker.persona_id,
+                persona_name=worker.persona_name,
                 memory_usage_mb=self.memory_monitor.get_memory_mb()
             )
             
@@ -2244,8 +2312,8 @@ class Orchestrator:
         return {
             wid: {
                 "worker_id": wid,
-                "persona_id": w.persona.id if w.persona else None,
-                "persona_name": w.persona.name if w.persona else None,
+                "persona_id": w.persona_id,
+                "persona_name": w.persona_name,
                 "display_id": w.display_id
             }
             for wid, w in self.workers.items()
@@ -2260,8 +2328,8 @@ class Orchestrator:
             "debate_rounds": self.debate_rounds,
             "workers": {
                 wid: {
-                    "persona_id": w.persona.id if w.persona else None,
-                    "persona_name": w.persona.name if w.persona else None,
+                    "persona_id": w.persona_id,
+                    "persona_name": w.persona_name,
                     "display_id": w.display_id,
                     "has_draft": w.current_draft is not None,
                     "refinement_count": len(w.refinements),
@@ -2329,8 +2397,8 @@ class Orchestrator:
             "workers": {
                 wid: {
                     "id": wid,
-                    "persona_id": w.persona.id if w.persona else None,
-                    "persona_name": w.persona.name if w.persona else None,
+                    "persona_id": w.persona_id,
+                    "persona_name": w.persona_name,
                     "display_id": w.display_id,
                     "draft": w.current_draft.to_dict() if w.current_draft else None,
                     "argument": w.argument.to_dict() if w.argument else None
@@ -2360,3 +2428,7 @@ class Orchestrator:
             }
         
         return state
+    
+    def close(self):
+        """Release resources held by this session (Ollama connection pool)."""
+        self.runtime.close()
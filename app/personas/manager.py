@@ -37,7 +37,8 @@ class PersonaManager:
     """
     Manages persona storage and retrieval.
     
-    Personas are stored in a JSON file and loaded on demand.
+    Personas are stored in a JSON file and loaded on demand. The cache is
+    reloaded when the file is modified by another manager instance.
     Default personas from config are merged with user-created ones.
     """
     
@@ -58,12 +59,20 @@ class PersonaManager:
         
         # Cache
         self._personas: Optional[Dict[str, Persona]] = None
+        self._loaded_mtime: Optional[int] = None
         self._default_personas: List[Dict[str, Any]] = []
     
     def set_default_personas(self, defaults: List[Dict[str, Any]]):
         """Set default personas from configuration."""
         self._default_personas = defaults
     
+    def _file_mtime(self) -> Optional[int]:
+        """Get the personas file modification time, or None if it doesn't exist."""
+        try:
+            return self.personas_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
     def _load_personas(self) -> Dict[str, Persona]:
         """Load personas from storage."""
         personas = {}
@@ -112,12 +121,17 @@ class PersonaManager:
         
         with open(self.personas_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        
+        # Our own write shouldn't trigger a reload
+        self._loaded_mtime = self._file_mtime()
     
     @property
     def personas(self) -> Dict[str, Persona]:
-        """Get all personas (cached)."""
-        if self._personas is None:
+        """Get all personas (cached until the personas file changes)."""
+        mtime = self._file_mtime()
+        if self._personas is None or mtime != self._loaded_mtime:
             self._personas = self._load_personas()
+            self._loaded_mtime = mtime
         return self._personas
     
     def get_all_personas(self) -> List[Dict[str, Any]]:
@@ -0,0 +1,33 @@
+"""
+AI Council - API Schemas
+Request body models for the JSON API, validated in a single parse pass.
+"""
+
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class StartSessionRequest(BaseModel):
+    """Body of POST /api/session/start."""
+    prompt: str = ""
+    personas: Dict[str, Any] = Field(default_factory=dict)  # {worker_id: persona_id}
+    debate_rounds: Optional[int] = None
+    argument_rounds: Optional[int] = None
+    collaboration_rounds: Optional[int] = None
+    axiom_rounds: Optional[int] = None
+    worker_count: Optional[int] = None  # UI override (2-4 workers)
+    worker_max_tokens: Optional[int] = None
+    synth_max_tokens: Optional[int] = None
+    worker_context_window: Optional[int] = None  # UI override (1K-32K)
+    synth_context_window: Optional[int] = None  # UI override (1K-32K)
+
+
+class VoteRequest(BaseModel):
+    """Body of POST /api/session/<id>/vote."""
+    votes: Dict[str, Any] = Field(default_factory=dict)  # {candidate_id: rank}
+    candidate_feedback: Dict[str, Any] = Field(default_factory=dict)  # {candidate_id: feedback_text}
+    overall_feedback: Optional[str] = ""
+    worker_feedback: Dict[str, Any] = Field(default_factory=dict)  # {worker_id: feedback_text}
+    synthesizer_feedback: Optional[str] = ""
+    prompt_rating: Optional[int] = 0  # 1-5, 0 = skip
+    prompt_feedback: Optional[str] = ""
@@ -5,7 +5,8 @@ Memory monitoring, logging, and helper functions.
 
 from .memory import MemoryMonitor
 from .logging import SessionLogger
+from .session_store import SessionStore
 
-__all__ = ["MemoryMonitor", "SessionLogger"]
+__all__ = ["MemoryMonitor", "SessionLogger", "SessionStore"]
 
 
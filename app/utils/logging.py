@@ -7,7 +7,7 @@ import json
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 
 
@@ -62,6 +62,8 @@ class SessionLogger:
         
         # In-memory buffer for current session
         self._entries: List[LogEntry] = []
+        # First entry per (stage, agent_id, input_hash), for cache lookups
+        self._hash_index: Dict[Tuple[str, str, str], LogEntry] = {}
     
     @staticmethod
     def compute_hash(text: str) -> str:
@@ -85,7 +87,8 @@ class SessionLogger:
         user_vote: Optional[int] = None,
         user_feedback: Optional[str] = None,
         ai_score: Optional[float] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        input_hash: Optional[str] = None
     ) -> LogEntry:
         """
         Log a pipeline event.
@@ -102,6 +105,7 @@ class SessionLogger:
             user_feedback: Optional user feedback text.
             ai_score: Optional AI-assigned score.
             metadata: Optional additional metadata.
+            input_hash: Precomputed compute_hash(input_text), if the caller has it.
         
         Returns:
             The created LogEntry.
@@ -114,7 +118,7 @@ class SessionLogger:
             persona_id=persona_id,
             persona_name=persona_name,
             ram_mode=self.ram_mode,
-            input_hash=self.compute_hash(input_text),
+            input_hash=input_hash or self.compute_hash(input_text),
             input_tokens=self.estimate_tokens(input_text),
             input_text=input_text,  # Include full input text for debugging
             output_text=output_text,
@@ -128,6 +132,7 @@ class SessionLogger:
         
         # Add to buffer
         self._entries.append(entry)
+        self._hash_index.setdefault((entry.stage, entry.agent_id, entry.input_hash), entry)
         
         # Write to file
         self._write_entry(entry)
@@ -151,9 +156,18 @@ class SessionLogger:
                 if hasattr(entry, key):
                     setattr(entry, key, value)
             
+            if updates.keys() & {"stage", "agent_id", "input_hash"}:
+                self._rebuild_hash_index()
+            
             # Rewrite file
             self._rewrite_file()
     
+    def _rebuild_hash_index(self):
+        """Re-index all entries after a lookup key was changed."""
+        self._hash_index = {}
+        for entry in self._entries:
+            self._hash_index.setdefault((entry.stage, entry.agent_id, entry.input_hash), entry)
+    
     def _rewrite_file(self):
         """Rewrite the entire log file from buffer."""
         with open(self.log_file, 'w', encoding='utf-8') as f:
@@ -176,10 +190,7 @@ class SessionLogger:
 
     def find_entry(self, stage: str, agent_id: str, input_hash: str) -> Optional[LogEntry]:
         """Find a matching entry by stage, agent, and input hash."""
-        for entry in self._entries:
-            if entry.stage == stage and entry.agent_id == agent_id and entry.input_hash == input_hash:
-                return entry
-        return None
+        return self._hash_index.get((stage, agent_id, input_hash))
 
     def has_entry(self, stage: str, agent_id: str, input_hash: str) -> bool:
         """Check if a matching entry exists by stage, agent, and input hash."""
@@ -3,11 +3,16 @@ AI Council - Memory Monitoring
 Tracks RAM and VRAM usage for mode enforcement.
 """
 
+import time
 import psutil
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
+# Log calls within this window share one RAM reading
+_MEMORY_MB_CACHE_SECONDS = 0.1
+
+
 @dataclass
 class MemoryStatus:
     """Current memory status."""
@@ -40,6 +45,7 @@ class MemoryMonitor:
         """
         self.max_ram_percent = max_ram_percent
         self._has_nvidia = self._check_nvidia()
+        self._memory_mb_cache: Optional[Tuple[float, int]] = None  # (read_at, used_mb)
     
     def _check_nvidia(self) -> bool:
         """Check if NVIDIA GPU monitoring is available."""
@@ -190,7 +196,13 @@ class MemoryMonitor:
         return False
     
     def get_memory_mb(self) -> int:
-        """Get current RAM usage in MB (for logging)."""
-        return int(psutil.virtual_memory().used / (1024 ** 2))
+        """Get current RAM usage in MB (for logging), reusing a reading up to 100ms old."""
+        now = time.monotonic()
+        cached = self._memory_mb_cache
+        if cached is not None and now - cached[0] < _MEMORY_MB_CACHE_SECONDS:
+            return cached[1]
+        used_mb = int(psutil.virtual_memory().used / (1024 ** 2))
+        self._memory_mb_cache = (now, used_mb)
+        return used_mb
 
 
@@ -0,0 +1,72 @@
+"""
+AI Council - JSON Serialization
+Fast JSON encoding/decoding using orjson when available.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to the standard library
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one name covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode dataclasses and enums for stdlib json the way orjson does natively."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: JSON-compatible object (non-string dict keys are stringified).
+            Dataclass instances are encoded field by field and enums by value.
+        indent: Pretty-print with two-space indentation (for files on disk).
+        sort_keys: Sort dict keys, for output that is stable enough to hash.
+    
+    Returns:
+        JSON document as bytes.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys, default=_default).encode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=_default
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text as bytes or str.
+    
+    Returns:
+        The decoded object.
+    
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
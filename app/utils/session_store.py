@@ -0,0 +1,102 @@
+"""
+AI Council - Session Store
+Bounded in-memory registry of active council sessions.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class SessionStore:
+    """
+    Maps session IDs to their orchestrators with bounded memory use.
+    
+    Sessions idle for longer than the TTL expire, and the least recently
+    used session is evicted once the store is full. Looking a session up
+    counts as activity.
+    """
+    
+    def __init__(
+        self,
+        max_sessions: int = 128,
+        ttl_seconds: float = 3600,
+        on_evict: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Initialize session store.
+        
+        Args:
+            max_sessions: Maximum number of sessions kept at once.
+            ttl_seconds: Idle time after which a session expires.
+            on_evict: Called with each orchestrator that expires or is
+                evicted (not for pop), outside the store's lock.
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self._sessions: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _prune(self, now: float) -> List[Any]:
+        """
+        Drop expired sessions, then the oldest ones beyond capacity.
+        
+        Returns:
+            The orchestrators that were dropped.
+        """
+        evicted = []
+        # Oldest entries are first, so stop at the first live one
+        while self._sessions:
+            session_id, (last_used, orchestrator) = next(iter(self._sessions.items()))
+            if now - last_used <= self.ttl_seconds:
+                break
+            del self._sessions[session_id]
+            evicted.append(orchestrator)
+        
+        while len(self._sessions) > self.max_sessions:
+            evicted.append(self._sessions.popitem(last=False)[1][1])
+        return evicted
+    
+    def _evict(self, evicted: List[Any]):
+        """Run the eviction callback for dropped sessions."""
+        if self.on_evict is None:
+            return
+        for orchestrator in evicted:
+            self.on_evict(orchestrator)
+    
+    def add(self, session_id: str, orchestrator: Any):
+        """Register a session."""
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session_id] = (now, orchestrator)
+            self._sessions.move_to_end(session_id)
+            evicted = self._prune(now)
+        self._evict(evicted)
+    
+    def get(self, session_id: str) -> Optional[Any]:
+        """
+        Get a session's orchestrator and mark it as recently used.
+        
+        Returns:
+            The orchestrator, or None if unknown or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            evicted = self._prune(now)
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                self._sessions[session_id] = (now, entry[1])
+                self._sessions.move_to_end(session_id)
+        self._evict(evicted)
+        return entry[1] if entry else None
+    
+    def pop(self, session_id: str) -> Optional[Any]:
+        """Remove a session, returning its orchestrator if it was present."""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+        return entry[1] if entry else None
+    
+    def __len__(self) -> int:
+        return len(self._sessions)